@@ -1,1175 +1,2218 @@
-# -*- coding: utf-8 -*-
-"""
-Raster Blaster - Improved Version
-A QGIS plugin for streamlined raster georeferencing using GDAL.
-
-Quick Wins Implemented:
-1. Background processing with QgsTask (no more UI freezes)
-2. Progress bar support
-3. User-selectable CRS (not hardcoded to EPSG:3857)
-4. Persistent settings (remembers your preferences)
-5. Auto-load results into QGIS
-"""
-
-import os
-import subprocess
-import csv
-import tempfile
-import time
-import re
-
-from qgis.PyQt.QtCore import QTimer, Qt
-from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtWidgets import (
-    QAction, QApplication, QFileDialog, QMessageBox,
-    QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QToolBar, QComboBox, QCheckBox, QProgressBar, QGroupBox, QSpinBox
-)
-from qgis.core import (
-    QgsMessageLog, Qgis, QgsTask, QgsApplication, 
-    QgsRasterLayer, QgsProject, QgsSettings,
-    QgsCoordinateReferenceSystem
-)
-from qgis.gui import QgsProjectionSelectionWidget
-
-# Qt5/Qt6 compatibility for QMessageBox button enums
-try:
-    # Qt6 style
-    QMessageBoxYes = QMessageBox.StandardButton.Yes
-    QMessageBoxNo = QMessageBox.StandardButton.No
-except AttributeError:
-    # Qt5 style
-    QMessageBoxYes = QMessageBox.Yes
-    QMessageBoxNo = QMessageBox.No
-
-
-class GdalTask(QgsTask):
-    """
-    Background task for running GDAL commands without freezing the UI.
-    Parses GDAL progress output to update the task progress bar.
-    """
-    
-    def __init__(self, description, commands, cleanup_files=None, output_file=None):
-        """
-        Args:
-            description: Task description shown in task manager
-            commands: List of (cmd_list, cmd_description) tuples to execute
-            cleanup_files: List of temp files to delete after completion
-            output_file: Path to output file (for auto-loading)
-        """
-        super().__init__(description, QgsTask.CanCancel)
-        self.commands = commands
-        self.cleanup_files = cleanup_files or []
-        self.output_file = output_file
-        self.error_message = None
-        self.elapsed_time = 0
-        self.exception = None
-    
-    def run(self):
-        """Execute GDAL commands in background thread."""
-        start_time = time.time()
-        total_commands = len(self.commands)
-        
-        try:
-            for idx, (cmd, cmd_desc) in enumerate(self.commands):
-                if self.isCanceled():
-                    return False
-                
-                # Base progress for this command
-                base_progress = (idx / total_commands) * 100
-                command_weight = 100 / total_commands
-                
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: Running {cmd_desc}',
-                    'Raster Blaster', level=Qgis.Info
-                )
-                QgsMessageLog.logMessage(
-                    f'Command: {" ".join(cmd)}',
-                    'Raster Blaster', level=Qgis.Info
-                )
-                
-                # Run process and capture progress
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1
-                )
-                
-                # Read stderr for progress updates (GDAL outputs progress there)
-                stderr_output = []
-                while True:
-                    if self.isCanceled():
-                        process.terminate()
-                        return False
-                    
-                    line = process.stderr.readline()
-                    if not line and process.poll() is not None:
-                        break
-                    
-                    if line:
-                        stderr_output.append(line)
-                        # Parse GDAL progress (format: "...10...20...30..." or percentage)
-                        progress_match = re.search(r'(\d+)(?:\.\d+)?%?\.{0,3}$', line.strip())
-                        if progress_match:
-                            try:
-                                pct = float(progress_match.group(1))
-                                overall = base_progress + (pct / 100) * command_weight
-                                self.setProgress(overall)
-                            except ValueError:
-                                pass
-                
-                # Get remaining output
-                _, remaining_stderr = process.communicate()
-                stderr_output.append(remaining_stderr)
-                
-                if process.returncode != 0:
-                    self.error_message = ''.join(stderr_output).strip()
-                    return False
-                
-                # Update progress for completed command
-                self.setProgress(base_progress + command_weight)
-            
-            self.elapsed_time = time.time() - start_time
-            return True
-            
-        except Exception as e:
-            self.exception = e
-            self.error_message = str(e)
-            return False
-    
-    def finished(self, result):
-        """Called when task completes (in main thread)."""
-        # Clean up temp files
-        for f in self.cleanup_files:
-            try:
-                if os.path.exists(f):
-                    os.remove(f)
-            except Exception:
-                pass
-    
-    def cancel(self):
-        """Handle task cancellation."""
-        QgsMessageLog.logMessage(
-            'Raster Blaster: Task cancelled by user',
-            'Raster Blaster', level=Qgis.Warning
-        )
-        super().cancel()
-
-
-class raster_blaster:
-    """Main plugin class."""
-    
-    # Settings keys
-    SETTINGS_PREFIX = 'raster_blaster/'
-    SETTING_LAST_DIR = 'last_directory'
-    SETTING_COMPRESSION = 'compression'
-    SETTING_RESAMPLING = 'resampling'
-    SETTING_TRANSFORM = 'transformation'
-    SETTING_CRS = 'target_crs'
-    SETTING_AUTO_LOAD = 'auto_load_result'
-    SETTING_JPEG_QUALITY = 'jpeg_quality'
-    
-    def __init__(self, iface):
-        self.iface = iface
-        self.connected = False
-        self.gcp_table = None
-        self.settings = QgsSettings()
-        self.active_tasks = []
-
-        # Kick off polling for the Georeferencer window
-        QTimer.singleShot(1000, self.try_connect)
-
-    def initGui(self):
-        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
-        icon = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
-
-        # Points→GeoTIFF
-        self.act_full = QAction(icon, "Points→GeoTIFF", self.iface.mainWindow())
-        self.act_full.triggered.connect(self.full_process_dialog)
-        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_full)
-
-        # Points→COG
-        self.act_to_cog = QAction(icon, "Points→COG", self.iface.mainWindow())
-        self.act_to_cog.triggered.connect(self.full_to_cog_dialog)
-        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_to_cog)
-
-        # GeoTIFF→COG
-        self.act_cog = QAction(icon, "GeoTIFF→COG", self.iface.mainWindow())
-        self.act_cog.triggered.connect(self.gdal_cog_dialog)
-        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_cog)
-
-    def unload(self):
-        for act in (self.act_full, self.act_to_cog, self.act_cog):
-            try:
-                self.iface.removePluginRasterMenu("&Raster Blaster", act)
-            except Exception:
-                pass
-
-    def try_connect(self):
-        """Poll for Georeferencer window and add toolbar buttons when found."""
-        for w in QApplication.topLevelWidgets():
-            if w.metaObject().className() == 'QgsGeoreferencerMainWindow':
-                QgsMessageLog.logMessage(
-                    'Raster Blaster: Found Georeferencer', 
-                    'Raster Blaster', level=Qgis.Info
-                )
-                self.setup_georef(w)
-                return
-        QTimer.singleShot(1000, self.try_connect)
-
-    def setup_georef(self, georef):
-        """Add buttons to Georeferencer toolbar."""
-        tb = georef.findChild(QToolBar, 'toolBarFile')
-        if not tb:
-            return
-        
-        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
-        icon = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
-        
-        for txt, cb in [
-            ('Points→GeoTIFF', self.full_process_dialog),
-            ('Points→COG', self.full_to_cog_dialog),
-            ('GeoTIFF→COG', self.gdal_cog_dialog)
-        ]:
-            act = QAction(icon, txt, georef)
-            act.triggered.connect(cb)
-            tb.addSeparator()
-            tb.addAction(act)
-
-    # =========================================================================
-    # Settings helpers
-    # =========================================================================
-    
-    def get_setting(self, key, default=''):
-        """Retrieve a saved setting."""
-        return self.settings.value(self.SETTINGS_PREFIX + key, default)
-    
-    def save_setting(self, key, value):
-        """Save a setting."""
-        self.settings.setValue(self.SETTINGS_PREFIX + key, value)
-
-    # =========================================================================
-    # Dialog builder
-    # =========================================================================
-    
-    def _gdal_dialog(self, title, fields, callback):
-        """
-        Build a dialog with file selectors, dropdowns, and options.
-        
-        Fields format: list of (label, key, field_type)
-        Field types:
-            - 'points_file': .points file selector
-            - 'input_file': generic input file selector
-            - 'output_geotiff': output GeoTIFF selector
-            - 'output_cog': output COG selector
-            - 'transform': transformation method dropdown
-            - 'resample': resampling method dropdown
-            - 'compress': compression dropdown
-            - 'crs': CRS selector widget
-            - 'jpeg_quality': JPEG quality spinbox
-        """
-        dlg = QDialog(self.iface.mainWindow())
-        dlg.setWindowTitle(title)
-        dlg.setMinimumWidth(500)
-        layout = QVBoxLayout()
-        inputs = {}
-        
-        # File inputs group
-        file_group = QGroupBox("Files")
-        file_layout = QVBoxLayout()
-        
-        # Options group
-        options_group = QGroupBox("Options")
-        options_layout = QVBoxLayout()
-        
-        for label, key, field_type in fields:
-            hl = QHBoxLayout()
-            lbl = QLabel(label)
-            lbl.setMinimumWidth(120)
-            
-            # CRS selector
-            if field_type == 'crs':
-                crs_widget = QgsProjectionSelectionWidget()
-                # Load saved CRS or default to EPSG:3857
-                saved_crs = self.get_setting(self.SETTING_CRS, 'EPSG:3857')
-                crs_widget.setCrs(QgsCoordinateReferenceSystem(saved_crs))
-                hl.addWidget(lbl)
-                hl.addWidget(crs_widget)
-                options_layout.addLayout(hl)
-                inputs[key] = crs_widget
-                continue
-            
-            # Transformation dropdown
-            if field_type == 'transform':
-                combo = QComboBox()
-                combo.addItems([
-                    'TPS',
-                    'RPC',
-                    'Geoloc',
-                    'Polynomial (order 1)',
-                    'Polynomial (order 2)',
-                    'Polynomial (order 3)'
-                ])
-                saved = self.get_setting(self.SETTING_TRANSFORM, 'TPS')
-                idx = combo.findText(saved)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-                hl.addWidget(lbl)
-                hl.addWidget(combo)
-                options_layout.addLayout(hl)
-                inputs[key] = combo
-                continue
-
-            # Resampling dropdown
-            if field_type == 'resample':
-                combo = QComboBox()
-                combo.addItems([
-                    'lanczos', 'near', 'bilinear', 'cubic', 'cubicspline',
-                    'average', 'mode', 'max', 'min', 'med'
-                ])
-                saved = self.get_setting(self.SETTING_RESAMPLING, 'lanczos')
-                idx = combo.findText(saved)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-                hl.addWidget(lbl)
-                hl.addWidget(combo)
-                options_layout.addLayout(hl)
-                inputs[key] = combo
-                continue
-
-            # Compression dropdown
-            if field_type == 'compress':
-                combo = QComboBox()
-                combo.addItems(['JPEG', 'LZW', 'DEFLATE', 'PACKBITS', 'ZSTD', 'NONE'])
-                saved = self.get_setting(self.SETTING_COMPRESSION, 'JPEG')
-                idx = combo.findText(saved)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-                hl.addWidget(lbl)
-                hl.addWidget(combo)
-                options_layout.addLayout(hl)
-                inputs[key] = combo
-                continue
-            
-            # JPEG Quality spinbox
-            if field_type == 'jpeg_quality':
-                spin = QSpinBox()
-                spin.setRange(1, 100)
-                spin.setValue(int(self.get_setting(self.SETTING_JPEG_QUALITY, '85')))
-                spin.setSuffix('%')
-                hl.addWidget(lbl)
-                hl.addWidget(spin)
-                options_layout.addLayout(hl)
-                inputs[key] = spin
-                continue
-
-            # File selectors
-            edit = QLineEdit()
-            btn = QPushButton('Browse...')
-            
-            if field_type == 'points_file':
-                def make_browse_points(edit_widget):
-                    def browse_points():
-                        path, _ = QFileDialog.getOpenFileName(
-                            None, "Select Points File",
-                            "",
-                            "Points Files (*.points);;All Files (*)"
-                        )
-                        if path:
-                            edit_widget.setText(path)
-                    return browse_points
-                btn.clicked.connect(make_browse_points(edit))
-                hl.addWidget(lbl)
-                hl.addWidget(edit)
-                hl.addWidget(btn)
-                file_layout.addLayout(hl)
-                
-            elif field_type == 'input_file':
-                def make_browse_input(edit_widget, all_inputs, all_fields):
-                    def browse_input():
-                        path, _ = QFileDialog.getOpenFileName(
-                            None, "Select Input Image",
-                            "",
-                            "Image Files (*.tif *.tiff *.jpg *.jpeg *.png);;All Files (*)"
-                        )
-                        if path:
-                            edit_widget.setText(path)
-                            
-                            # Auto-fill output field if empty
-                            for flabel, fkey, ftype in all_fields:
-                                if ftype in ('output_geotiff', 'output_cog'):
-                                    output_widget = all_inputs.get(fkey)
-                                    if output_widget and not output_widget.text():
-                                        suffix = '_cog.tif' if 'cog' in ftype else '_georef.tif'
-                                        output_path = os.path.splitext(path)[0] + suffix
-                                        output_widget.setText(output_path)
-                                    break
-                    return browse_input
-                btn.clicked.connect(make_browse_input(edit, inputs, fields))
-                hl.addWidget(lbl)
-                hl.addWidget(edit)
-                hl.addWidget(btn)
-                file_layout.addLayout(hl)
-                
-            elif field_type in ('output_geotiff', 'output_cog'):
-                suffix = '_cog.tif' if 'cog' in field_type else '_georef.tif'
-                
-                def make_browse_output(edit_widget, sfx):
-                    def browse_output():
-                        # Try to suggest name based on input
-                        inp = inputs.get('input_file')
-                        base = ''
-                        if inp and inp.text():
-                            base = os.path.splitext(inp.text())[0] + sfx
-                        path, _ = QFileDialog.getSaveFileName(
-                            None, "Save Output",
-                            base,
-                            "TIFF Files (*.tif)"
-                        )
-                        if path:
-                            if not path.lower().endswith('.tif'):
-                                path += '.tif'
-                            edit_widget.setText(path)
-                    return browse_output
-                btn.clicked.connect(make_browse_output(edit, suffix))
-                hl.addWidget(lbl)
-                hl.addWidget(edit)
-                hl.addWidget(btn)
-                file_layout.addLayout(hl)
-            
-            inputs[key] = edit
-        
-        # Add groups to main layout
-        file_group.setLayout(file_layout)
-        layout.addWidget(file_group)
-        
-        options_group.setLayout(options_layout)
-        layout.addWidget(options_group)
-        
-        # Auto-load checkbox
-        auto_load_cb = QCheckBox("Automatically add result to map")
-        auto_load_cb.setChecked(self.get_setting(self.SETTING_AUTO_LOAD, 'true') == 'true')
-        layout.addWidget(auto_load_cb)
-        inputs['auto_load'] = auto_load_cb
-        
-        # Progress bar (hidden initially)
-        progress = QProgressBar()
-        progress.setVisible(False)
-        progress.setTextVisible(True)
-        layout.addWidget(progress)
-        inputs['progress'] = progress
-        
-        # Status label
-        status_label = QLabel("")
-        layout.addWidget(status_label)
-        inputs['status'] = status_label
-        
-        # Buttons
-        btn_layout = QHBoxLayout()
-        run_btn = QPushButton('Run')
-        cancel_btn = QPushButton('Cancel')
-        cancel_btn.clicked.connect(dlg.reject)
-        
-        def on_run():
-            # Save settings
-            if 'compress' in inputs:
-                self.save_setting(self.SETTING_COMPRESSION, inputs['compress'].currentText())
-            if 'resample' in inputs:
-                self.save_setting(self.SETTING_RESAMPLING, inputs['resample'].currentText())
-            if 'transform' in inputs:
-                self.save_setting(self.SETTING_TRANSFORM, inputs['transform'].currentText())
-            if 'crs' in inputs:
-                self.save_setting(self.SETTING_CRS, inputs['crs'].crs().authid())
-            if 'jpeg_quality' in inputs:
-                self.save_setting(self.SETTING_JPEG_QUALITY, str(inputs['jpeg_quality'].value()))
-            self.save_setting(self.SETTING_AUTO_LOAD, 'true' if auto_load_cb.isChecked() else 'false')
-            
-            # Collect values
-            values = {}
-            for lbl, key, ftype in fields:
-                widget = inputs[key]
-                if isinstance(widget, QComboBox):
-                    values[key] = widget.currentText()
-                elif isinstance(widget, QgsProjectionSelectionWidget):
-                    values[key] = widget.crs()
-                elif isinstance(widget, QSpinBox):
-                    values[key] = widget.value()
-                else:
-                    values[key] = widget.text()
-            
-            values['auto_load'] = auto_load_cb.isChecked()
-            values['progress'] = progress
-            values['status'] = status_label
-            values['dialog'] = dlg
-            values['run_button'] = run_btn
-            
-            callback(values)
-        
-        run_btn.clicked.connect(on_run)
-        btn_layout.addWidget(run_btn)
-        btn_layout.addWidget(cancel_btn)
-        layout.addLayout(btn_layout)
-        
-        dlg.setLayout(layout)
-        
-        # Qt5/Qt6 compatibility: exec_() renamed to exec() in Qt6
-        if hasattr(dlg, 'exec'):
-            dlg.exec()
-        else:
-            dlg.exec_()
-
-    # =========================================================================
-    # GeoTIFF → COG
-    # =========================================================================
-    
-    def gdal_cog_dialog(self):
-        self._gdal_dialog('GeoTIFF → COG', [
-            ('Input GeoTIFF', 'input_file', 'input_file'),
-            ('Compression', 'compress', 'compress'),
-            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
-            ('Output COG', 'output_file', 'output_cog')
-        ], self.gdal_cog)
-
-    def gdal_cog(self, values):
-        """Convert GeoTIFF to COG using background task."""
-        tif = values['input_file']
-        compress = values['compress']
-        jpeg_quality = values['jpeg_quality']
-        cog = values['output_file']
-        auto_load = values['auto_load']
-        progress = values['progress']
-        status = values['status']
-        dlg = values['dialog']
-        run_btn = values['run_button']
-        
-        # Validate inputs
-        if not tif or not os.path.exists(tif):
-            QMessageBox.warning(dlg, "Error", "Please select a valid input file.")
-            return
-        if not cog:
-            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
-            return
-        
-        # Check if output file exists
-        if os.path.exists(cog):
-            reply = QMessageBox.question(
-                dlg, "File Exists",
-                f"Output file already exists:\n{os.path.basename(cog)}\n\nOverwrite?",
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-            # Delete existing file
-            try:
-                os.remove(cog)
-            except Exception as e:
-                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
-                return
-        
-        # Build command
-        cmd = [
-            'gdal_translate', tif, cog,
-            '-of', 'COG',
-            '-co', f'COMPRESS={compress}',
-            '--config', 'GDAL_NUM_THREADS', 'ALL_CPUS'
-        ]
-        
-        # Add JPEG quality if using JPEG compression
-        if compress == 'JPEG':
-            cmd.extend(['-co', f'QUALITY={jpeg_quality}'])
-        
-        # Show progress
-        progress.setVisible(True)
-        progress.setValue(0)
-        status.setText("Processing...")
-        run_btn.setEnabled(False)
-        
-        # Create and run task
-        task = GdalTask(
-            'Raster Blaster: Creating COG',
-            [(cmd, 'gdal_translate → COG')],
-            output_file=cog
-        )
-        
-        def on_complete(exception, result=None):
-            progress.setVisible(False)
-            run_btn.setEnabled(True)
-            
-            if task.error_message:
-                status.setText(f"Error: {task.error_message[:100]}")
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: COG failed: {task.error_message}',
-                    'Raster Blaster', level=Qgis.Critical
-                )
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    f"COG creation failed",
-                    level=Qgis.Critical
-                )
-            else:
-                mins, secs = divmod(int(task.elapsed_time), 60)
-                status.setText(f"Complete! ({mins:02d}:{secs:02d})")
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    f"COG created: {os.path.basename(cog)} ({mins:02d}:{secs:02d})",
-                    level=Qgis.Success
-                )
-                
-                if auto_load:
-                    self.load_raster_layer(cog)
-                
-                dlg.accept()
-        
-        task.taskCompleted.connect(lambda: on_complete(None))
-        task.taskTerminated.connect(lambda: on_complete(task.exception))
-        
-        QgsApplication.taskManager().addTask(task)
-        self.active_tasks.append(task)
-
-    # =========================================================================
-    # Points → GeoTIFF
-    # =========================================================================
-    
-    def full_process_dialog(self):
-        self._gdal_dialog('Points → GeoTIFF', [
-            ('Points File', 'points_file', 'points_file'),
-            ('Input Image', 'input_file', 'input_file'),
-            ('Target CRS', 'crs', 'crs'),
-            ('Transformation', 'transform', 'transform'),
-            ('Resampling', 'resample', 'resample'),
-            ('Compression', 'compress', 'compress'),
-            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
-            ('Output GeoTIFF', 'output_file', 'output_geotiff')
-        ], self.full_process)
-
-    def full_process(self, values):
-        """Create GeoTIFF from points file using background task."""
-        pf = values['points_file']
-        tif = values['input_file']
-        crs = values['crs']
-        transform = values['transform']
-        resample = values['resample']
-        compress = values['compress']
-        jpeg_quality = values['jpeg_quality']
-        out_tif = values['output_file']
-        auto_load = values['auto_load']
-        progress = values['progress']
-        status = values['status']
-        dlg = values['dialog']
-        run_btn = values['run_button']
-        
-        # Validate inputs
-        if not pf or not os.path.exists(pf):
-            QMessageBox.warning(dlg, "Error", "Please select a valid points file.")
-            return
-        if not tif or not os.path.exists(tif):
-            QMessageBox.warning(dlg, "Error", "Please select a valid input image.")
-            return
-        if not out_tif:
-            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
-            return
-        
-        # Check if output file exists
-        if os.path.exists(out_tif):
-            reply = QMessageBox.question(
-                dlg, "File Exists",
-                f"Output file already exists:\n{os.path.basename(out_tif)}\n\nOverwrite?",
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-            try:
-                os.remove(out_tif)
-            except Exception as e:
-                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
-                return
-        
-        # Parse GCPs from points file
-        try:
-            gcp_data = self.parse_points_file(pf)
-            if gcp_data['count'] == 0:
-                QMessageBox.warning(dlg, "Error", "No enabled GCPs found in points file.")
-                return
-        except Exception as e:
-            QMessageBox.warning(dlg, "Error", f"Failed to read points file: {e}")
-            return
-        
-        # Validate GCP count for selected transformation
-        is_valid, warning_msg = self.validate_gcps_for_transform(gcp_data['count'], transform)
-        if not is_valid:
-            QMessageBox.critical(dlg, "Insufficient GCPs", warning_msg)
-            return
-        if warning_msg:
-            reply = QMessageBox.warning(
-                dlg, "GCP Warning", warning_msg,
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-        
-        # Check GCP distribution
-        distribution_warning = self.check_gcp_distribution(gcp_data['gcps'])
-        if distribution_warning:
-            reply = QMessageBox.warning(
-                dlg, "GCP Distribution Warning", distribution_warning,
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-        
-        # Create temp VRT path
-        tmp_vrt = tempfile.NamedTemporaryFile(delete=False, suffix='.vrt')
-        tmp_vrt.close()
-        vrt_path = tmp_vrt.name
-        
-        # Build gdal_translate command (create VRT with GCPs)
-        cmd1 = ['gdal_translate', '-of', 'VRT'] + gcp_data['args'] + [tif, vrt_path]
-        
-        # Build gdalwarp command
-        if transform.lower().startswith('polynomial'):
-            order = transform.split('order')[-1].strip().strip(')')
-            transform_args = ['-order', order]
-        else:
-            transform_args = [f'-{transform.lower()}']
-        
-        cmd2 = [
-            'gdalwarp',
-            '-t_srs', crs.authid(),
-            '-r', resample,
-            *transform_args,
-            '--config', 'GDAL_NUM_THREADS', 'ALL_CPUS',
-            '-wo', 'NUM_THREADS=ALL_CPUS',
-            '-multi',
-            '-co', 'BIGTIFF=YES',
-            '-co', 'TILED=YES',
-            '-co', f'COMPRESS={compress}'
-        ]
-        
-        if compress == 'JPEG':
-            cmd2.extend(['-co', f'JPEG_QUALITY={jpeg_quality}'])
-        
-        cmd2.extend([vrt_path, out_tif])
-        
-        # Show progress
-        progress.setVisible(True)
-        progress.setValue(0)
-        status.setText("Processing...")
-        run_btn.setEnabled(False)
-        
-        # Create task
-        task = GdalTask(
-            'Raster Blaster: Creating GeoTIFF',
-            [
-                (cmd1, 'gdal_translate → VRT'),
-                (cmd2, 'gdalwarp → GeoTIFF')
-            ],
-            cleanup_files=[vrt_path],
-            output_file=out_tif
-        )
-        
-        def on_complete(exception, result=None):
-            progress.setVisible(False)
-            run_btn.setEnabled(True)
-            
-            if task.error_message:
-                status.setText(f"Error: {task.error_message[:100]}")
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: GeoTIFF failed: {task.error_message}',
-                    'Raster Blaster', level=Qgis.Critical
-                )
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    "GeoTIFF creation failed",
-                    level=Qgis.Critical
-                )
-            else:
-                mins, secs = divmod(int(task.elapsed_time), 60)
-                status.setText(f"Complete! ({mins:02d}:{secs:02d})")
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    f"GeoTIFF created: {os.path.basename(out_tif)} ({mins:02d}:{secs:02d})",
-                    level=Qgis.Success
-                )
-                
-                if auto_load:
-                    self.load_raster_layer(out_tif)
-                
-                dlg.accept()
-        
-        task.taskCompleted.connect(lambda: on_complete(None))
-        task.taskTerminated.connect(lambda: on_complete(task.exception))
-        
-        QgsApplication.taskManager().addTask(task)
-        self.active_tasks.append(task)
-
-    # =========================================================================
-    # Points → COG
-    # =========================================================================
-    
-    def full_to_cog_dialog(self):
-        self._gdal_dialog('Points → COG', [
-            ('Points File', 'points_file', 'points_file'),
-            ('Input Image', 'input_file', 'input_file'),
-            ('Target CRS', 'crs', 'crs'),
-            ('Transformation', 'transform', 'transform'),
-            ('Resampling', 'resample', 'resample'),
-            ('Compression', 'compress', 'compress'),
-            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
-            ('Output COG', 'output_file', 'output_cog')
-        ], self.full_to_cog)
-
-    def full_to_cog(self, values):
-        """Create COG from points file using background task."""
-        pf = values['points_file']
-        tif = values['input_file']
-        crs = values['crs']
-        transform = values['transform']
-        resample = values['resample']
-        compress = values['compress']
-        jpeg_quality = values['jpeg_quality']
-        out_cog = values['output_file']
-        auto_load = values['auto_load']
-        progress = values['progress']
-        status = values['status']
-        dlg = values['dialog']
-        run_btn = values['run_button']
-        
-        # Validate inputs
-        if not pf or not os.path.exists(pf):
-            QMessageBox.warning(dlg, "Error", "Please select a valid points file.")
-            return
-        if not tif or not os.path.exists(tif):
-            QMessageBox.warning(dlg, "Error", "Please select a valid input image.")
-            return
-        if not out_cog:
-            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
-            return
-        
-        # Check if output file exists
-        if os.path.exists(out_cog):
-            reply = QMessageBox.question(
-                dlg, "File Exists",
-                f"Output file already exists:\n{os.path.basename(out_cog)}\n\nOverwrite?",
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-            try:
-                os.remove(out_cog)
-            except Exception as e:
-                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
-                return
-        
-        # Parse GCPs
-        try:
-            gcp_data = self.parse_points_file(pf)
-            if gcp_data['count'] == 0:
-                QMessageBox.warning(dlg, "Error", "No enabled GCPs found in points file.")
-                return
-        except Exception as e:
-            QMessageBox.warning(dlg, "Error", f"Failed to read points file: {e}")
-            return
-        
-        # Validate GCP count for selected transformation
-        is_valid, warning_msg = self.validate_gcps_for_transform(gcp_data['count'], transform)
-        if not is_valid:
-            QMessageBox.critical(dlg, "Insufficient GCPs", warning_msg)
-            return
-        if warning_msg:
-            reply = QMessageBox.warning(
-                dlg, "GCP Warning", warning_msg,
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-        
-        # Check GCP distribution
-        distribution_warning = self.check_gcp_distribution(gcp_data['gcps'])
-        if distribution_warning:
-            reply = QMessageBox.warning(
-                dlg, "GCP Distribution Warning", distribution_warning,
-                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
-            )
-            if reply == QMessageBoxNo:
-                return
-        
-        # Create temp VRT
-        tmp_vrt = tempfile.NamedTemporaryFile(delete=False, suffix='.vrt')
-        tmp_vrt.close()
-        vrt_path = tmp_vrt.name
-        
-        # Build commands
-        cmd1 = ['gdal_translate', '-of', 'VRT'] + gcp_data['args'] + [tif, vrt_path]
-        
-        if transform.lower().startswith('polynomial'):
-            order = transform.split('order')[-1].strip().strip(')')
-            transform_args = ['-order', order]
-        else:
-            transform_args = [f'-{transform.lower()}']
-        
-        cmd2 = [
-            'gdalwarp',
-            '-of', 'COG',
-            '-t_srs', crs.authid(),
-            '-r', resample,
-            *transform_args,
-            '--config', 'GDAL_NUM_THREADS', 'ALL_CPUS',
-            '-wo', 'NUM_THREADS=ALL_CPUS',
-            '-multi',
-            '-co', 'BIGTIFF=YES',
-            '-co', f'COMPRESS={compress}'
-        ]
-        
-        if compress == 'JPEG':
-            cmd2.extend(['-co', f'QUALITY={jpeg_quality}'])
-        
-        cmd2.extend([vrt_path, out_cog])
-        
-        # Show progress
-        progress.setVisible(True)
-        progress.setValue(0)
-        status.setText("Processing...")
-        run_btn.setEnabled(False)
-        
-        # Create task
-        task = GdalTask(
-            'Raster Blaster: Creating COG',
-            [
-                (cmd1, 'gdal_translate → VRT'),
-                (cmd2, 'gdalwarp → COG')
-            ],
-            cleanup_files=[vrt_path],
-            output_file=out_cog
-        )
-        
-        def on_complete(exception, result=None):
-            progress.setVisible(False)
-            run_btn.setEnabled(True)
-            
-            if task.error_message:
-                status.setText(f"Error: {task.error_message[:100]}")
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: COG failed: {task.error_message}',
-                    'Raster Blaster', level=Qgis.Critical
-                )
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    "COG creation failed",
-                    level=Qgis.Critical
-                )
-            else:
-                mins, secs = divmod(int(task.elapsed_time), 60)
-                status.setText(f"Complete! ({mins:02d}:{secs:02d})")
-                self.iface.messageBar().pushMessage(
-                    "Raster Blaster",
-                    f"COG created: {os.path.basename(out_cog)} ({mins:02d}:{secs:02d})",
-                    level=Qgis.Success
-                )
-                
-                if auto_load:
-                    self.load_raster_layer(out_cog)
-                
-                dlg.accept()
-        
-        task.taskCompleted.connect(lambda: on_complete(None))
-        task.taskTerminated.connect(lambda: on_complete(task.exception))
-        
-        QgsApplication.taskManager().addTask(task)
-        self.active_tasks.append(task)
-
-    # =========================================================================
-    # Utility methods
-    # =========================================================================
-    
-    def parse_points_file(self, filepath):
-        """
-        Parse a QGIS .points file and return GCP info.
-        
-        Returns dict with:
-            'args': list like ['-gcp', 'sx', 'sy', 'mx', 'my', ...]
-            'count': number of enabled GCPs
-            'gcps': list of (sx, sy, mx, my) tuples for validation
-        """
-        result = {
-            'args': [],
-            'count': 0,
-            'gcps': []
-        }
-        
-        # Try different encodings
-        encodings = ['utf-8', 'windows-1252', 'latin-1']
-        content = None
-        
-        for encoding in encodings:
-            try:
-                with open(filepath, 'r', encoding=encoding) as f:
-                    content = f.read()
-                break
-            except UnicodeDecodeError:
-                continue
-        
-        if content is None:
-            raise ValueError("Could not decode points file with any supported encoding")
-        
-        # Filter out comments and empty lines
-        lines = [l for l in content.splitlines() if l.strip() and not l.startswith('#')]
-        
-        if not lines:
-            return result
-        
-        # Parse as CSV
-        reader = csv.DictReader(lines)
-        
-        for row in reader:
-            # Check if GCP is enabled
-            enable = row.get('enable', '1').strip()
-            if enable != '1':
-                continue
-            
-            try:
-                sx = float(row['sourceX'])
-                sy = -float(row['sourceY'])  # QGIS uses inverted Y for source
-                mx = float(row['mapX'])
-                my = float(row['mapY'])
-                result['args'].extend(['-gcp', str(sx), str(sy), str(mx), str(my)])
-                result['gcps'].append((sx, sy, mx, my))
-                result['count'] += 1
-            except (KeyError, ValueError) as e:
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: Skipping invalid GCP row: {e}',
-                    'Raster Blaster', level=Qgis.Warning
-                )
-                continue
-        
-        return result
-    
-    def validate_gcps_for_transform(self, gcp_count, transform_type):
-        """
-        Validate that there are enough GCPs for the selected transformation.
-        
-        Returns tuple: (is_valid, warning_message or None)
-        
-        Minimum GCP requirements:
-        - Polynomial order 1: 3 GCPs (affine)
-        - Polynomial order 2: 6 GCPs
-        - Polynomial order 3: 10 GCPs
-        - TPS: 1 GCP minimum, but 10+ recommended
-        - RPC/Geoloc: varies, typically need several
-        """
-        transform_lower = transform_type.lower()
-        
-        # Define minimum requirements
-        if 'polynomial' in transform_lower:
-            if 'order 1' in transform_lower or 'order1' in transform_lower:
-                min_gcps = 3
-                recommended = 4
-                transform_name = "Polynomial (order 1)"
-            elif 'order 2' in transform_lower or 'order2' in transform_lower:
-                min_gcps = 6
-                recommended = 8
-                transform_name = "Polynomial (order 2)"
-            elif 'order 3' in transform_lower or 'order3' in transform_lower:
-                min_gcps = 10
-                recommended = 15
-                transform_name = "Polynomial (order 3)"
-            else:
-                min_gcps = 3
-                recommended = 4
-                transform_name = "Polynomial"
-        elif transform_lower == 'tps':
-            min_gcps = 1
-            recommended = 10
-            transform_name = "Thin Plate Spline (TPS)"
-        else:
-            # RPC, Geoloc - less strict
-            min_gcps = 1
-            recommended = 6
-            transform_name = transform_type
-        
-        # Check requirements
-        if gcp_count < min_gcps:
-            return (False, 
-                f"{transform_name} requires at least {min_gcps} GCPs.\n"
-                f"You only have {gcp_count} enabled GCP(s).\n\n"
-                f"Please add more ground control points or choose a different transformation method."
-            )
-        elif gcp_count < recommended:
-            return (True,
-                f"Warning: {transform_name} works best with {recommended}+ GCPs.\n"
-                f"You have {gcp_count} GCP(s). Results may be less accurate.\n\n"
-                f"Continue anyway?"
-            )
-        
-        return (True, None)
-    
-    def check_gcp_distribution(self, gcps):
-        """
-        Check if GCPs are well-distributed across the image.
-        
-        Returns warning message if GCPs appear clustered, None otherwise.
-        """
-        if len(gcps) < 3:
-            return None
-        
-        # Extract source coordinates
-        src_x = [g[0] for g in gcps]
-        src_y = [g[1] for g in gcps]
-        
-        # Calculate spread (using range as simple metric)
-        x_range = max(src_x) - min(src_x)
-        y_range = max(src_y) - min(src_y)
-        
-        # Calculate centroid
-        cx = sum(src_x) / len(src_x)
-        cy = sum(src_y) / len(src_y)
-        
-        # Check if all points are in one quadrant relative to centroid
-        # (simple clustering detection)
-        quadrants = set()
-        for x, y in zip(src_x, src_y):
-            q = (1 if x >= cx else 0, 1 if y >= cy else 0)
-            quadrants.add(q)
-        
-        if len(quadrants) == 1 and len(gcps) >= 4:
-            return (
-                "Warning: All GCPs appear to be clustered in one area of the image.\n"
-                "For best results, distribute GCPs across all corners and edges.\n\n"
-                "Continue anyway?"
-            )
-        
-        # Check for very narrow spread (points nearly collinear)
-        if x_range > 0 and y_range > 0:
-            aspect = min(x_range, y_range) / max(x_range, y_range)
-            if aspect < 0.1 and len(gcps) >= 4:
-                return (
-                    "Warning: GCPs appear to be arranged in a nearly straight line.\n"
-                    "This may cause distortion. Try adding GCPs that form a wider pattern.\n\n"
-                    "Continue anyway?"
-                )
-        
-        return None
-    
-    def load_raster_layer(self, filepath):
-        """Load a raster file into QGIS as a new layer."""
-        try:
-            name = os.path.splitext(os.path.basename(filepath))[0]
-            layer = QgsRasterLayer(filepath, name)
-            
-            if layer.isValid():
-                QgsProject.instance().addMapLayer(layer)
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: Added layer "{name}" to map',
-                    'Raster Blaster', level=Qgis.Info
-                )
-            else:
-                QgsMessageLog.logMessage(
-                    f'Raster Blaster: Failed to load layer from {filepath}',
-                    'Raster Blaster', level=Qgis.Warning
-                )
-        except Exception as e:
-            QgsMessageLog.logMessage(
-                f'Raster Blaster: Error loading layer: {e}',
-                'Raster Blaster', level=Qgis.Warning
-            )
+# -*- coding: utf-8 -*-
+"""
+Raster Blaster - Improved Version
+A QGIS plugin for streamlined raster georeferencing using GDAL.
+
+Quick Wins Implemented:
+1. Background processing with QgsTask (no more UI freezes)
+2. Progress bar support
+3. User-selectable CRS (not hardcoded to EPSG:3857)
+4. Persistent settings (remembers your preferences)
+5. Auto-load results into QGIS
+"""
+
+import collections
+import functools
+import io
+import itertools
+import os
+import subprocess
+import selectors
+import tempfile
+import time
+import re
+
+import numpy as np
+
+from qgis.PyQt.QtCore import QTimer, Qt, QFileSystemWatcher
+from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtWidgets import (
+    QAction, QApplication, QFileDialog, QMessageBox,
+    QDialog, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QLineEdit,
+    QToolBar, QComboBox, QCheckBox, QProgressBar, QGroupBox, QSpinBox
+)
+from qgis.core import (
+    QgsMessageLog, Qgis, QgsTask, QgsApplication, 
+    QgsRasterLayer, QgsProject, QgsSettings,
+    QgsCoordinateReferenceSystem
+)
+from qgis.gui import QgsProjectionSelectionWidget
+
+# GDAL Python bindings. QGIS ships these, but keep the subprocess-based
+# fallback working if the import ever fails (broken osgeo install).
+try:
+    from osgeo import gdal, osr
+except ImportError:
+    gdal = None
+    osr = None
+
+# psutil is bundled with most QGIS installs; used only to size GDAL's caches
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# COG structure validator from GDAL's bundled python utils (optional)
+try:
+    from osgeo_utils.samples.validate_cloud_optimized_geotiff import (
+        validate as _validate_cog,
+    )
+except ImportError:
+    _validate_cog = None
+
+# Qt5/Qt6 compatibility for QMessageBox button enums
+try:
+    # Qt6 style
+    QMessageBoxYes = QMessageBox.StandardButton.Yes
+    QMessageBoxNo = QMessageBox.StandardButton.No
+except AttributeError:
+    # Qt5 style
+    QMessageBoxYes = QMessageBox.Yes
+    QMessageBoxNo = QMessageBox.No
+
+# (min_gcps, recommended_gcps, display_name) per canonical transform key.
+# RPC/Geoloc fall through to a lenient default in the lookup.
+_TRANSFORM_RULES = {
+    'polynomial1': (3, 4, 'Polynomial (order 1)'),
+    'polynomial2': (6, 8, 'Polynomial (order 2)'),
+    'polynomial3': (10, 15, 'Polynomial (order 3)'),
+    'tps': (1, 10, 'Thin Plate Spline (TPS)'),
+}
+_POLY_ORDER_RE = re.compile(r'order\s*([123])')
+
+_gdal_ready = False
+
+
+def _ensure_gdal_init():
+    """
+    One-time GDAL warm-up for the in-process pipeline: register drivers
+    and set session-wide defaults once, instead of paying registration
+    per job the way each CLI subprocess used to.
+    """
+    global _gdal_ready
+    if _gdal_ready or gdal is None:
+        return
+    gdal.AllRegister()
+    # Touching an EPSG lookup opens the PROJ database now, so the first
+    # warp doesn't pay that cold start. No config options here: anything
+    # process-global would reconfigure GDAL for every raster the host
+    # QGIS session opens, not just our jobs (see _TASK_CONFIG_DEFAULTS).
+    if osr is not None:
+        osr.SpatialReference().ImportFromEPSG(3857)
+    _gdal_ready = True
+
+
+# Baseline per-job GDAL tuning, applied thread-locally by GdalPyTask so
+# it never bleeds into the rest of the QGIS process: all-core processing
+# plus a VSI read cache (256 MB) for repeated block fetches from the
+# same input. A task's own config_options override these.
+_TASK_CONFIG_DEFAULTS = {
+    'GDAL_NUM_THREADS': 'ALL_CPUS',
+    'VSI_CACHE': 'TRUE',
+    'VSI_CACHE_SIZE': str(256 * 1024 * 1024),
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _cog_creation_options(compress, jpeg_quality):
+    """
+    Immutable creation-option tuple for a COG preset. Power users re-run
+    the same preset repeatedly; the cache hands back the prebuilt tuple
+    instead of re-formatting the option strings on every Run click.
+    """
+    opts = (f'COMPRESS={compress}', 'NUM_THREADS=ALL_CPUS',
+            'OVERVIEW_RESAMPLING=AVERAGE')
+    if compress == 'JPEG':
+        opts += (f'QUALITY={jpeg_quality}',)
+    return opts
+
+
+def _predictor_option(src_path, compress):
+    """
+    PREDICTOR creation option matched to the source band datatype:
+    3 (floating-point differencing) for Float32/64, 2 (horizontal
+    differencing) for integer types. Only meaningful for the LZW-family
+    compressors; returns None otherwise or when the source cannot be
+    probed (the subprocess fallback just skips the option).
+    """
+    if gdal is None or compress not in ('LZW', 'DEFLATE', 'ZSTD'):
+        return None
+    try:
+        ds = gdal.Open(src_path)
+        if ds is None:
+            return None
+        dt = ds.GetRasterBand(1).DataType
+    except Exception:
+        return None
+    pred = 3 if dt in (gdal.GDT_Float32, gdal.GDT_Float64) else 2
+    return f'PREDICTOR={pred}'
+
+
+def _remote_io_options(src_path):
+    """
+    Extra GDAL config for remote inputs (/vsicurl/, S3, plain URLs),
+    where per-block round-trips dominate wall time: multiplex the HTTP
+    connection, merge consecutive range requests, enlarge the curl
+    cache and retry transient failures. Empty for local paths.
+    """
+    if not src_path.startswith(('/vsi', 'http://', 'https://', 's3://')):
+        return {}
+    return {
+        # Only for remote inputs: sidecar hunting costs a round-trip per
+        # candidate there. Local jobs keep directory discovery so
+        # external .ovr pyramids and .aux.xml stats are found.
+        'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR',
+        'GDAL_HTTP_MULTIPLEX': 'YES',
+        'GDAL_HTTP_MERGE_CONSECUTIVE_RANGES': 'YES',
+        'CPL_VSIL_CURL_CACHE_SIZE': str(200 * 1024 * 1024),
+        'GDAL_HTTP_MAX_RETRY': '3',
+        'GDAL_HTTP_RETRY_DELAY': '1',
+    }
+
+
+def _validate_cog_step(path, creation_options):
+    """
+    Step factory: check the freshly written COG and, if the validator
+    reports structural errors (some VRT-backed inputs yield bad IFD
+    ordering), rebuild it through a materialized plain GeoTIFF. Turns a
+    silently broken COG into a correct one for a little extra time; a
+    clean validation costs only the header scan.
+
+    The preceding translate step must have closed its writer handle
+    (it returns True, not the dataset) — the rebuild overwrites `path`,
+    which fails on Windows while anything still holds it open.
+    """
+    def check(prev, progress_cb):
+        if _validate_cog is None:
+            return True
+        try:
+            _, errors, _ = _validate_cog(path, full_check=False)
+        except Exception:
+            return True
+        if not errors:
+            return True
+        QgsMessageLog.logMessage(
+            f'Raster Blaster: Output failed COG validation, rebuilding: '
+            f'{"; ".join(str(e) for e in errors)}',
+            'Raster Blaster', level=Qgis.Warning
+        )
+        mid = path + '.mid.tif'
+        ok = False
+        # COPY_SRC_OVERVIEWS carries the overview levels through the
+        # intermediate: the caller's options may say
+        # OVERVIEWS=FORCE_USE_EXISTING, which would otherwise turn the
+        # rebuild into a COG with zero levels. stats=True keeps the
+        # precomputed statistics too.
+        mid_ds = gdal.Translate(mid, path, format='GTiff',
+                                creationOptions=['TILED=YES',
+                                                 'BIGTIFF=IF_SAFER',
+                                                 'COPY_SRC_OVERVIEWS=YES'])
+        if mid_ds is not None:
+            mid_ds = None
+            result = gdal.Translate(path, mid, format='COG',
+                                    creationOptions=creation_options,
+                                    stats=True,
+                                    callback=progress_cb)
+            ok = result is not None
+            result = None
+        # The intermediate goes away on the failure paths too
+        try:
+            os.unlink(mid)
+        except OSError:
+            pass
+        return True if ok else None
+    return check
+
+
+def _blocksize_option(src_path):
+    """
+    COG BLOCKSIZE matched to the source's native tile size, so each
+    output block maps onto whole input blocks instead of several
+    misaligned ones. Striped or unusually tiled sources fall back to
+    the 512 default.
+    """
+    if gdal is None:
+        return 'BLOCKSIZE=512'
+    try:
+        ds = gdal.Open(src_path)
+        if ds is None:
+            return 'BLOCKSIZE=512'
+        bx, by = ds.GetRasterBand(1).GetBlockSize()
+    except Exception:
+        return 'BLOCKSIZE=512'
+    if bx == by and bx in (256, 512, 1024):
+        return f'BLOCKSIZE={bx}'
+    return 'BLOCKSIZE=512'
+
+
+def _tail_pct(line):
+    """
+    Extract the trailing percentage from a GDAL progress line
+    ("0...10...20..." or "42%" or "42.5%") by walking the bytes backward.
+    Returns an int, or None when the line is not progress output.
+    Replaces the old regex: no engine, no strip() allocation.
+    """
+    i = len(line)
+    # Skip trailing whitespace and progress dots
+    while i and line[i - 1] in b'. \t\r\n':
+        i -= 1
+    if i and line[i - 1] == 0x25:  # '%'
+        i -= 1
+    j = i
+    while j and 0x30 <= line[j - 1] <= 0x39:  # digits
+        j -= 1
+    # Percentage with a decimal fraction: keep the integer part
+    if j and line[j - 1] == 0x2E:  # '.'
+        k = j - 1
+        while k and 0x30 <= line[k - 1] <= 0x39:
+            k -= 1
+        if k < j - 1:
+            i, j = j - 1, k
+    if j == i:
+        return None
+    return int(line[j:i])
+
+
+class GdalTask(QgsTask):
+    """
+    Background task for running GDAL commands without freezing the UI.
+    Parses GDAL progress output to update the task progress bar.
+    """
+    
+    def __init__(self, description, commands, cleanup_files=None, output_file=None):
+        """
+        Args:
+            description: Task description shown in task manager
+            commands: List of (cmd_list, cmd_description) tuples to execute
+            cleanup_files: List of temp files to delete after completion
+            output_file: Path to output file (for auto-loading)
+        """
+        super().__init__(description, QgsTask.CanCancel)
+        self.commands = commands
+        self.cleanup_files = cleanup_files or []
+        self.output_file = output_file
+        self.error_message = None
+        self.elapsed_time = 0
+        self.exception = None
+        self._last_progress_emit = 0.0
+    
+    def run(self):
+        """Execute GDAL commands in background thread."""
+        start_time = time.time()
+        total_commands = len(self.commands)
+        
+        try:
+            for idx, (cmd, cmd_desc) in enumerate(self.commands):
+                if self.isCanceled():
+                    return False
+                
+                # Base progress for this command
+                base_progress = (idx / total_commands) * 100
+                command_weight = 100 / total_commands
+                
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Running {cmd_desc}',
+                    'Raster Blaster', level=Qgis.Info
+                )
+                QgsMessageLog.logMessage(
+                    f'Command: {" ".join(cmd)}',
+                    'Raster Blaster', level=Qgis.Info
+                )
+                
+                # Run process and capture progress. Keep the pipe in binary
+                # mode: no per-line decoding in the hot loop. The GDAL tools
+                # write progress and errors to stderr, so capturing stdout
+                # would be pure overhead.
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE
+                )
+
+                # Drain stderr for progress updates (GDAL outputs progress
+                # there). On POSIX, read in 64 KB chunks via select +
+                # os.read rather than blocking on readline() per line: one
+                # syscall per chunk, newline splitting in one C call.
+                # Only the tail matters for error reporting, so cap what we
+                # retain instead of holding every progress tick in RAM.
+                stderr_output = collections.deque(maxlen=256)
+
+                def handle_line(line):
+                    stderr_output.append(line)
+                    # Cheap literal check first: most lines (warnings,
+                    # PROJ traces) are not progress, so skip the scan
+                    if b'%' not in line and b'.' not in line:
+                        return
+                    # Parse GDAL progress (format: "...10...20...30..." or percentage)
+                    pct = _tail_pct(line)
+                    if pct is not None and pct <= 100:
+                        # Throttle to <=10 Hz: every setProgress
+                        # queues a signal to the UI thread
+                        now = time.monotonic()
+                        if now - self._last_progress_emit > 0.1:
+                            self._last_progress_emit = now
+                            overall = base_progress + (pct / 100) * command_weight
+                            self.setProgress(overall)
+
+                if os.name == 'nt':
+                    # DefaultSelector on Windows is SelectSelector, which
+                    # only accepts sockets — registering a pipe raises
+                    # OSError. Fall back to blocking per-line reads there;
+                    # GDAL's progress dots arrive often enough that the
+                    # between-line cancellation check stays responsive.
+                    for raw in process.stderr:
+                        if self.isCanceled():
+                            process.terminate()
+                            return False
+                        handle_line(raw.rstrip(b'\r\n'))
+                else:
+                    buf = b''
+                    eof = False
+                    sel = selectors.DefaultSelector()
+                    sel.register(process.stderr, selectors.EVENT_READ)
+                    try:
+                        while not eof:
+                            if self.isCanceled():
+                                process.terminate()
+                                return False
+
+                            for key, _ in sel.select(0.1):
+                                chunk = os.read(key.fd, 65536)
+                                if not chunk:
+                                    eof = True
+                                    break
+                                buf += chunk
+
+                            *lines, buf = buf.split(b'\n')
+                            if eof and buf:
+                                lines.append(buf)
+                                buf = b''
+
+                            for line in lines:
+                                handle_line(line)
+                    finally:
+                        sel.close()
+
+                # Get remaining output
+                _, remaining_stderr = process.communicate()
+                if remaining_stderr:
+                    stderr_output.append(remaining_stderr)
+
+                if process.returncode != 0:
+                    self.error_message = b'\n'.join(stderr_output).decode(
+                        'utf-8', errors='replace').strip()
+                    return False
+                
+                # Update progress for completed command
+                self.setProgress(base_progress + command_weight)
+            
+            self.elapsed_time = time.time() - start_time
+            return True
+            
+        except Exception as e:
+            self.exception = e
+            self.error_message = str(e)
+            return False
+    
+    def finished(self, result):
+        """Called when task completes (in main thread)."""
+        # Clean up temp files. EAFP: unlink directly instead of paying an
+        # extra exists() stat per file on the UI thread.
+        for f in self.cleanup_files:
+            try:
+                os.unlink(f)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Could not remove temp file {f}: {e}',
+                    'Raster Blaster', level=Qgis.Warning
+                )
+
+    def cancel(self):
+        """Handle task cancellation."""
+        QgsMessageLog.logMessage(
+            'Raster Blaster: Task cancelled by user',
+            'Raster Blaster', level=Qgis.Warning
+        )
+        super().cancel()
+
+
+class GdalPyTask(QgsTask):
+    """
+    Background task that drives GDAL through the Python bindings instead of
+    spawning gdal_translate/gdalwarp subprocesses. This avoids per-invocation
+    process startup, driver registration and PROJ database opens, and gives
+    us a real progress callback instead of scraping stderr.
+    """
+
+    def __init__(self, description, steps, cleanup_files=None, output_file=None,
+                 config_options=None):
+        """
+        Args:
+            description: Task description shown in task manager
+            steps: List of (func, step_description) tuples. Each func is
+                called with (previous_result, progress_callback) and returns
+                a gdal.Dataset for the next step, or any other non-None
+                value if it closed its own output (None signals failure).
+            cleanup_files: List of temp files to delete after completion
+            output_file: Path to output file (for auto-loading)
+            config_options: Dict of GDAL config options set before running
+        """
+        super().__init__(description, QgsTask.CanCancel)
+        self.steps = steps
+        self.cleanup_files = cleanup_files or []
+        self.output_file = output_file
+        self.config_options = {**_TASK_CONFIG_DEFAULTS,
+                               **(config_options or {})}
+        self.error_message = None
+        self.elapsed_time = 0
+        self.exception = None
+        self._last_progress_emit = 0.0
+
+    def run(self):
+        """Execute GDAL API calls in background thread."""
+        start_time = time.time()
+        total_steps = len(self.steps)
+        result = None
+
+        _ensure_gdal_init()
+        # Thread-local config: scoped to this task's worker thread, so
+        # concurrent tasks don't race on process-wide globals and nothing
+        # leaks into the host QGIS session. Cleared on the way out because
+        # the task manager reuses its pool threads.
+        for key, value in self.config_options.items():
+            gdal.SetThreadLocalConfigOption(key, value)
+
+        try:
+            for idx, (func, step_desc) in enumerate(self.steps):
+                if self.isCanceled():
+                    return False
+
+                # Base progress for this step
+                base_progress = (idx / total_steps) * 100
+                step_weight = 100 / total_steps
+
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Running {step_desc}',
+                    'Raster Blaster', level=Qgis.Info
+                )
+
+                # Clear any stale error state so a failure reports this
+                # step's message, not one left over from a previous job
+                gdal.ErrorReset()
+
+                def progress(complete, message, data):
+                    # Returning 0 asks GDAL to abort the running operation,
+                    # so cancellation takes effect mid-step instead of after
+                    # the warp runs to completion
+                    if self.isCanceled():
+                        return 0
+                    # Throttle to <=10 Hz: every setProgress queues a
+                    # signal to the UI thread
+                    now = time.monotonic()
+                    if now - self._last_progress_emit > 0.1:
+                        self._last_progress_emit = now
+                        self.setProgress(base_progress + complete * step_weight)
+                    return 1
+
+                result = func(result, progress)
+
+                if result is None:
+                    msg = gdal.GetLastErrorMsg() if gdal else ''
+                    self.error_message = msg.strip() or f'{step_desc} failed'
+                    return False
+
+                self.setProgress(base_progress + step_weight)
+
+            # Release dataset handles so output files are flushed and closed
+            result = None
+
+            self.elapsed_time = time.time() - start_time
+            return True
+
+        except Exception as e:
+            self.exception = e
+            self.error_message = str(e)
+            return False
+
+        finally:
+            for key in self.config_options:
+                gdal.SetThreadLocalConfigOption(key, None)
+
+    def finished(self, result):
+        """Called when task completes (in main thread)."""
+        # Clean up temp files (/vsimem/ paths live in GDAL's memory FS).
+        # EAFP: unlink directly, no exists() pre-check.
+        for f in self.cleanup_files:
+            try:
+                if f.startswith('/vsimem/'):
+                    gdal.Unlink(f)
+                else:
+                    os.unlink(f)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Could not remove temp file {f}: {e}',
+                    'Raster Blaster', level=Qgis.Warning
+                )
+
+    def cancel(self):
+        """Handle task cancellation."""
+        QgsMessageLog.logMessage(
+            'Raster Blaster: Task cancelled by user',
+            'Raster Blaster', level=Qgis.Warning
+        )
+        super().cancel()
+
+
+class raster_blaster:
+    """Main plugin class."""
+    
+    # Settings keys
+    SETTINGS_PREFIX = 'raster_blaster/'
+    SETTING_LAST_DIR = 'last_directory'
+    SETTING_COMPRESSION = 'compression'
+    SETTING_RESAMPLING = 'resampling'
+    SETTING_TRANSFORM = 'transformation'
+    SETTING_CRS = 'target_crs'
+    SETTING_AUTO_LOAD = 'auto_load_result'
+    SETTING_JPEG_QUALITY = 'jpeg_quality'
+
+    # Max number of parsed points files kept in the GCP cache
+    GCP_CACHE_SIZE = 16
+
+    # Cap on concurrently running conversion jobs. GDAL already fans each
+    # warp/compress out across the cores, so a couple of simultaneous jobs
+    # keeps the machine busy during a batch without thrashing; anything
+    # beyond the cap waits in a queue instead of piling onto the CPU.
+    MAX_CONCURRENT_TASKS = max(1, min(4, (os.cpu_count() or 4) // 4))
+
+    def __init__(self, iface):
+        self.iface = iface
+        self.connected = False
+        self.gcp_table = None
+        self.settings = QgsSettings()
+        self.active_tasks = []
+        self._task_queue = collections.deque()
+        self._started_tasks = set()
+        self._running_tasks = 0
+
+        # CRS WKT per authid, so repeat runs hand GDAL a pre-resolved
+        # definition instead of re-parsing the EPSG code through PROJ
+        self._srs_wkt_cache = {}
+
+        # Parsed .points files keyed on path, LRU-bounded, so re-running
+        # with tweaked options skips the re-parse. Invalidation is
+        # event-driven: the watcher drops entries when the file changes,
+        # so cache hits don't even pay a stat.
+        self._gcp_cache = collections.OrderedDict()
+        self._gcp_watcher = QFileSystemWatcher()
+        self._gcp_watcher.fileChanged.connect(self._invalidate_gcp_cache)
+
+        # Load the plugin icon once; every action reuses this instance
+        icon_path = os.path.join(os.path.dirname(__file__), "icon.png")
+        self._icon = QIcon(icon_path) if os.path.exists(icon_path) else QIcon()
+
+        # Kick off polling for the Georeferencer window
+        QTimer.singleShot(1000, self.try_connect)
+
+    def initGui(self):
+        # Warm GDAL (driver registration, config, PROJ DB) at plugin load
+        # so the first conversion doesn't pay the cold start
+        _ensure_gdal_init()
+
+        icon = self._icon
+
+        # Points→GeoTIFF
+        self.act_full = QAction(icon, "Points→GeoTIFF", self.iface.mainWindow())
+        self.act_full.triggered.connect(self.full_process_dialog)
+        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_full)
+
+        # Points→COG
+        self.act_to_cog = QAction(icon, "Points→COG", self.iface.mainWindow())
+        self.act_to_cog.triggered.connect(self.full_to_cog_dialog)
+        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_to_cog)
+
+        # Points→GeoTIFF+COG
+        self.act_to_both = QAction(icon, "Points→GeoTIFF+COG",
+                                   self.iface.mainWindow())
+        self.act_to_both.triggered.connect(self.full_to_both_dialog)
+        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_to_both)
+
+        # GeoTIFF→COG
+        self.act_cog = QAction(icon, "GeoTIFF→COG", self.iface.mainWindow())
+        self.act_cog.triggered.connect(self.gdal_cog_dialog)
+        self.iface.addPluginToRasterMenu("&Raster Blaster", self.act_cog)
+
+    def unload(self):
+        for act in (self.act_full, self.act_to_cog, self.act_to_both,
+                    self.act_cog):
+            try:
+                self.iface.removePluginRasterMenu("&Raster Blaster", act)
+            except Exception:
+                pass
+
+    def try_connect(self):
+        """Poll for Georeferencer window and add toolbar buttons when found."""
+        if self.connected:
+            return
+        for w in QApplication.topLevelWidgets():
+            if w.metaObject().className() == 'QgsGeoreferencerMainWindow':
+                QgsMessageLog.logMessage(
+                    'Raster Blaster: Found Georeferencer',
+                    'Raster Blaster', level=Qgis.Info
+                )
+                self.connected = True
+                self.setup_georef(w)
+                return
+        QTimer.singleShot(1000, self.try_connect)
+
+    def setup_georef(self, georef):
+        """Add buttons to Georeferencer toolbar."""
+        tb = georef.findChild(QToolBar, 'toolBarFile')
+        if not tb:
+            return
+
+        icon = self._icon
+
+        for txt, cb in [
+            ('Points→GeoTIFF', self.full_process_dialog),
+            ('Points→COG', self.full_to_cog_dialog),
+            ('GeoTIFF→COG', self.gdal_cog_dialog)
+        ]:
+            act = QAction(icon, txt, georef)
+            act.triggered.connect(cb)
+            tb.addSeparator()
+            tb.addAction(act)
+
+    # =========================================================================
+    # Settings helpers
+    # =========================================================================
+    
+    def get_setting(self, key, default=''):
+        """Retrieve a saved setting."""
+        return self.settings.value(self.SETTINGS_PREFIX + key, default)
+    
+    def save_setting(self, key, value):
+        """Save a setting."""
+        self.settings.setValue(self.SETTINGS_PREFIX + key, value)
+
+    # =========================================================================
+    # Dialog builder
+    # =========================================================================
+    
+    def _gdal_dialog(self, title, fields, callback):
+        """
+        Build a dialog with file selectors, dropdowns, and options.
+        
+        Fields format: list of (label, key, field_type)
+        Field types:
+            - 'points_file': .points file selector
+            - 'input_file': generic input file selector
+            - 'output_geotiff': output GeoTIFF selector
+            - 'output_cog': output COG selector
+            - 'transform': transformation method dropdown
+            - 'resample': resampling method dropdown
+            - 'compress': compression dropdown
+            - 'crs': CRS selector widget
+            - 'jpeg_quality': JPEG quality spinbox
+        """
+        dlg = QDialog(self.iface.mainWindow())
+        dlg.setWindowTitle(title)
+        dlg.setMinimumWidth(500)
+        layout = QVBoxLayout()
+        inputs = {}
+        
+        # File inputs group
+        file_group = QGroupBox("Files")
+        file_layout = QVBoxLayout()
+        
+        # Options group
+        options_group = QGroupBox("Options")
+        options_layout = QVBoxLayout()
+
+        # Resolve the output field once, so the input-browse handler can
+        # auto-fill it with a dict lookup instead of rescanning `fields`
+        output_key = None
+        output_suffix = '_georef.tif'
+        for _, fkey, ftype in fields:
+            if ftype in ('output_geotiff', 'output_cog'):
+                output_key = fkey
+                output_suffix = '_cog.tif' if 'cog' in ftype else '_georef.tif'
+                break
+
+        # Shared browse handlers, bound per-row with functools.partial so we
+        # don't build a fresh closure factory (capturing the whole dialog
+        # state) for every field
+        def browse_points(edit_widget):
+            path, _ = QFileDialog.getOpenFileName(
+                None, "Select Points File",
+                self.get_setting(self.SETTING_LAST_DIR, ''),
+                "Points Files (*.points);;All Files (*)"
+            )
+            if path:
+                self.save_setting(self.SETTING_LAST_DIR, os.path.dirname(path))
+                edit_widget.setText(path)
+
+        def browse_input(edit_widget):
+            path, _ = QFileDialog.getOpenFileName(
+                None, "Select Input Image",
+                self.get_setting(self.SETTING_LAST_DIR, ''),
+                "Image Files (*.tif *.tiff *.jpg *.jpeg *.png);;All Files (*)"
+            )
+            if path:
+                self.save_setting(self.SETTING_LAST_DIR, os.path.dirname(path))
+                edit_widget.setText(path)
+
+                # Auto-fill output field if empty
+                if output_key is not None:
+                    output_widget = inputs.get(output_key)
+                    if output_widget and not output_widget.text():
+                        output_widget.setText(os.path.splitext(path)[0] + output_suffix)
+
+                # Probe the source once so the compression choices fit it:
+                # JPEG cannot encode float data or odd band counts, and
+                # picking it would only fail after a long run
+                compress_widget = inputs.get('compress')
+                if compress_widget is not None and gdal is not None:
+                    jpeg_ok = True
+                    try:
+                        ds = gdal.Open(path)
+                        if ds is not None:
+                            dt = ds.GetRasterBand(1).DataType
+                            jpeg_ok = (
+                                dt not in (gdal.GDT_Float32, gdal.GDT_Float64)
+                                and ds.RasterCount in (1, 3, 4)
+                            )
+                    except Exception:
+                        pass
+                    jpeg_idx = compress_widget.findText('JPEG')
+                    if jpeg_idx >= 0:
+                        compress_widget.model().item(jpeg_idx).setEnabled(jpeg_ok)
+                        if not jpeg_ok and compress_widget.currentIndex() == jpeg_idx:
+                            compress_widget.setCurrentText('ZSTD')
+
+        def browse_output(edit_widget, sfx):
+            # Try to suggest name based on input
+            inp = inputs.get('input_file')
+            base = self.get_setting(self.SETTING_LAST_DIR, '')
+            if inp and inp.text():
+                base = os.path.splitext(inp.text())[0] + sfx
+            path, _ = QFileDialog.getSaveFileName(
+                None, "Save Output",
+                base,
+                "TIFF Files (*.tif)"
+            )
+            if path:
+                if not path.lower().endswith('.tif'):
+                    path += '.tif'
+                self.save_setting(self.SETTING_LAST_DIR, os.path.dirname(path))
+                edit_widget.setText(path)
+
+        for label, key, field_type in fields:
+            hl = QHBoxLayout()
+            lbl = QLabel(label)
+            lbl.setMinimumWidth(120)
+            
+            # CRS selector
+            if field_type == 'crs':
+                crs_widget = QgsProjectionSelectionWidget()
+                # Load saved CRS or default to EPSG:3857
+                saved_crs = self.get_setting(self.SETTING_CRS, 'EPSG:3857')
+                crs_widget.setCrs(QgsCoordinateReferenceSystem(saved_crs))
+                hl.addWidget(lbl)
+                hl.addWidget(crs_widget)
+                options_layout.addLayout(hl)
+                inputs[key] = crs_widget
+                continue
+            
+            # Transformation dropdown
+            if field_type == 'transform':
+                combo = QComboBox()
+                combo.addItems([
+                    'TPS',
+                    'RPC',
+                    'Geoloc',
+                    'Polynomial (order 1)',
+                    'Polynomial (order 2)',
+                    'Polynomial (order 3)'
+                ])
+                saved = self.get_setting(self.SETTING_TRANSFORM, 'TPS')
+                idx = combo.findText(saved)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+                hl.addWidget(lbl)
+                hl.addWidget(combo)
+                options_layout.addLayout(hl)
+                inputs[key] = combo
+                continue
+
+            # Resampling dropdown
+            if field_type == 'resample':
+                combo = QComboBox()
+                combo.addItems([
+                    'lanczos', 'near', 'bilinear', 'cubic', 'cubicspline',
+                    'average', 'mode', 'max', 'min', 'med'
+                ])
+                saved = self.get_setting(self.SETTING_RESAMPLING, 'lanczos')
+                idx = combo.findText(saved)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+                hl.addWidget(lbl)
+                hl.addWidget(combo)
+                options_layout.addLayout(hl)
+                inputs[key] = combo
+                continue
+
+            # Compression dropdown
+            if field_type == 'compress':
+                combo = QComboBox()
+                # ZSTD first: smaller and faster than LZW/DEFLATE on
+                # imagery with the same lossless guarantee. The LERC
+                # variants suit float rasters (lossless at MAX_Z_ERROR=0).
+                combo.addItems(['ZSTD', 'DEFLATE', 'LZW', 'JPEG',
+                                'PACKBITS', 'LERC', 'LERC_DEFLATE',
+                                'LERC_ZSTD', 'NONE'])
+                saved = self.get_setting(self.SETTING_COMPRESSION, 'JPEG')
+                idx = combo.findText(saved)
+                if idx >= 0:
+                    combo.setCurrentIndex(idx)
+                hl.addWidget(lbl)
+                hl.addWidget(combo)
+                options_layout.addLayout(hl)
+                inputs[key] = combo
+                continue
+            
+            # JPEG Quality spinbox
+            if field_type == 'jpeg_quality':
+                spin = QSpinBox()
+                spin.setRange(1, 100)
+                spin.setValue(int(self.get_setting(self.SETTING_JPEG_QUALITY, '85')))
+                spin.setSuffix('%')
+                hl.addWidget(lbl)
+                hl.addWidget(spin)
+                options_layout.addLayout(hl)
+                inputs[key] = spin
+                continue
+
+            # File selectors
+            edit = QLineEdit()
+            btn = QPushButton('Browse...')
+            
+            if field_type == 'points_file':
+                btn.clicked.connect(functools.partial(browse_points, edit))
+                hl.addWidget(lbl)
+                hl.addWidget(edit)
+                hl.addWidget(btn)
+                file_layout.addLayout(hl)
+
+            elif field_type == 'input_file':
+                btn.clicked.connect(functools.partial(browse_input, edit))
+                hl.addWidget(lbl)
+                hl.addWidget(edit)
+                hl.addWidget(btn)
+                file_layout.addLayout(hl)
+
+            elif field_type in ('output_geotiff', 'output_cog'):
+                suffix = '_cog.tif' if 'cog' in field_type else '_georef.tif'
+                btn.clicked.connect(functools.partial(browse_output, edit, suffix))
+                hl.addWidget(lbl)
+                hl.addWidget(edit)
+                hl.addWidget(btn)
+                file_layout.addLayout(hl)
+
+            inputs[key] = edit
+        
+        # Add groups to main layout
+        file_group.setLayout(file_layout)
+        layout.addWidget(file_group)
+        
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+        
+        # Auto-load checkbox
+        auto_load_cb = QCheckBox("Automatically add result to map")
+        auto_load_cb.setChecked(self.get_setting(self.SETTING_AUTO_LOAD, 'true') == 'true')
+        layout.addWidget(auto_load_cb)
+        inputs['auto_load'] = auto_load_cb
+        
+        # Progress bar (hidden initially)
+        progress = QProgressBar()
+        progress.setVisible(False)
+        progress.setTextVisible(True)
+        layout.addWidget(progress)
+        inputs['progress'] = progress
+        
+        # Status label
+        status_label = QLabel("")
+        layout.addWidget(status_label)
+        inputs['status'] = status_label
+        
+        # Buttons
+        btn_layout = QHBoxLayout()
+        run_btn = QPushButton('Run')
+        cancel_btn = QPushButton('Cancel')
+        cancel_btn.clicked.connect(dlg.reject)
+        
+        def on_run():
+            # Save settings
+            if 'compress' in inputs:
+                self.save_setting(self.SETTING_COMPRESSION, inputs['compress'].currentText())
+            if 'resample' in inputs:
+                self.save_setting(self.SETTING_RESAMPLING, inputs['resample'].currentText())
+            if 'transform' in inputs:
+                self.save_setting(self.SETTING_TRANSFORM, inputs['transform'].currentText())
+            if 'crs' in inputs:
+                self.save_setting(self.SETTING_CRS, inputs['crs'].crs().authid())
+            if 'jpeg_quality' in inputs:
+                self.save_setting(self.SETTING_JPEG_QUALITY, str(inputs['jpeg_quality'].value()))
+            self.save_setting(self.SETTING_AUTO_LOAD, 'true' if auto_load_cb.isChecked() else 'false')
+            
+            # Collect values
+            values = {}
+            for lbl, key, ftype in fields:
+                widget = inputs[key]
+                if isinstance(widget, QComboBox):
+                    values[key] = widget.currentText()
+                elif isinstance(widget, QgsProjectionSelectionWidget):
+                    values[key] = widget.crs()
+                elif isinstance(widget, QSpinBox):
+                    values[key] = widget.value()
+                else:
+                    values[key] = widget.text()
+            
+            values['auto_load'] = auto_load_cb.isChecked()
+            values['progress'] = progress
+            values['status'] = status_label
+            values['dialog'] = dlg
+            values['run_button'] = run_btn
+            
+            callback(values)
+        
+        run_btn.clicked.connect(on_run)
+        btn_layout.addWidget(run_btn)
+        btn_layout.addWidget(cancel_btn)
+        layout.addLayout(btn_layout)
+        
+        dlg.setLayout(layout)
+        
+        # Qt5/Qt6 compatibility: exec_() renamed to exec() in Qt6
+        if hasattr(dlg, 'exec'):
+            dlg.exec()
+        else:
+            dlg.exec_()
+
+    # =========================================================================
+    # GeoTIFF → COG
+    # =========================================================================
+    
+    def gdal_cog_dialog(self):
+        self._gdal_dialog('GeoTIFF → COG', [
+            ('Input GeoTIFF', 'input_file', 'input_file'),
+            ('Compression', 'compress', 'compress'),
+            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
+            ('Output COG', 'output_file', 'output_cog')
+        ], self.gdal_cog)
+
+    def gdal_cog(self, values):
+        """Convert GeoTIFF to COG using background task."""
+        tif = values['input_file']
+        compress = values['compress']
+        jpeg_quality = values['jpeg_quality']
+        cog = values['output_file']
+        auto_load = values['auto_load']
+        progress = values['progress']
+        status = values['status']
+        dlg = values['dialog']
+        run_btn = values['run_button']
+        
+        # Validate inputs (one stat per file)
+        tif_stat = self.stat_or_none(tif)
+        if tif_stat is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid input file.")
+            return
+        if not cog:
+            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
+            return
+
+        # Check if output file exists
+        if self.stat_or_none(cog) is not None:
+            reply = QMessageBox.question(
+                dlg, "File Exists",
+                f"Output file already exists:\n{os.path.basename(cog)}\n\nOverwrite?",
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+            # Delete existing file
+            try:
+                os.remove(cog)
+            except Exception as e:
+                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
+                return
+        
+        # Build creation options (cached per preset). Computing statistics
+        # now means QGIS can read them from the sidecar on load instead of
+        # scanning the file.
+        creation_options = list(_cog_creation_options(compress, jpeg_quality))
+        predictor = _predictor_option(tif, compress)
+        if predictor:
+            creation_options.append(predictor)
+        creation_options.append(_blocksize_option(tif))
+        if gdal is not None:
+            # COG-driver spelling of COPY_SRC_OVERVIEWS: the task's
+            # overview step guarantees levels exist, so make the driver
+            # copy them rather than resample fresh ones
+            creation_options.append('OVERVIEWS=FORCE_USE_EXISTING')
+
+        mem_mb = self.gdal_cache_mb()
+
+        # Show progress
+        progress.setVisible(True)
+        progress.setValue(0)
+        status.setText("Processing...")
+        run_btn.setEnabled(False)
+
+        # Create and run task
+        if gdal is not None:
+            # In-process gdal.Translate: no subprocess fork/exec, no driver
+            # re-registration, real progress callback
+            def build_overviews(prev, progress_cb):
+                # Pre-build external overviews (read-only open → .ovr
+                # sidecar) with the multithreaded resampler; the COG
+                # driver then copies them instead of regenerating every
+                # level itself. Sources that already have overviews skip
+                # straight to the translate.
+                ds = gdal.Open(tif)
+                if ds is None:
+                    return None
+                if ds.GetRasterBand(1).GetOverviewCount() == 0:
+                    ds.BuildOverviews('AVERAGE', [2, 4, 8, 16, 32],
+                                      callback=progress_cb)
+                return ds
+
+            def translate_cog(prev, progress_cb):
+                ds = gdal.Translate(
+                    cog, prev,
+                    format='COG',
+                    creationOptions=creation_options,
+                    stats=True,
+                    callback=progress_cb
+                )
+                if ds is None:
+                    return None
+                # Close the writer here so the validation step can reopen
+                # (and, on a rebuild, overwrite) the file — Windows refuses
+                # the overwrite while a handle is still open.
+                ds = None
+                return True
+
+            task = GdalPyTask(
+                'Raster Blaster: Creating COG',
+                [
+                    (build_overviews, 'gdal.BuildOverviews'),
+                    (translate_cog, 'gdal.Translate → COG'),
+                    (_validate_cog_step(cog, creation_options),
+                     'COG validation')
+                ],
+                output_file=cog,
+                # No GDAL_CACHEMAX here: the block cache is sized once per
+                # process, at first use — long before any task thread runs
+                # inside QGIS — so a per-task (thread-local) value never
+                # takes effect. Only the CLI fallback's --config and the
+                # warp paths' warpMemoryLimit carry the per-job budget.
+                config_options=_remote_io_options(tif)
+            )
+        else:
+            # Fallback: shell out to the GDAL command line tools
+            cmd = ['gdal_translate', tif, cog, '-of', 'COG', '-stats',
+                   '--config', 'GDAL_NUM_THREADS', 'ALL_CPUS',
+                   '--config', 'GDAL_CACHEMAX', str(mem_mb)]
+            for co in creation_options:
+                cmd.extend(['-co', co])
+
+            task = GdalTask(
+                'Raster Blaster: Creating COG',
+                [(cmd, 'gdal_translate → COG')],
+                output_file=cog
+            )
+        
+        def on_complete():
+            progress.setVisible(False)
+            run_btn.setEnabled(True)
+
+            # Cancelled first: a cancel while queued or between steps never
+            # sets error_message, and a mid-step one records "User
+            # terminated" — neither deserves a success or failure toast
+            if task.isCanceled():
+                status.setText("Cancelled")
+            elif task.error_message:
+                status.setText(f"Error: {task.error_message[:100]}")
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: COG failed: {task.error_message}',
+                    'Raster Blaster', level=Qgis.Critical
+                )
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"COG creation failed",
+                    level=Qgis.Critical
+                )
+            else:
+                mins, secs = divmod(int(task.elapsed_time), 60)
+                tstr = f"{mins:02d}:{secs:02d}"
+                status.setText(f"Complete! ({tstr})")
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"COG created: {os.path.basename(cog)} ({tstr})",
+                    level=Qgis.Success
+                )
+                
+                if auto_load:
+                    self.load_raster_layer(cog)
+                
+                dlg.accept()
+        
+        task.taskCompleted.connect(on_complete)
+        task.taskTerminated.connect(on_complete)
+        task.progressChanged.connect(lambda p: progress.setValue(int(p)))
+        # Closing the dialog mid-run cancels the job; the GDAL progress
+        # callback sees the flag and aborts the running step
+        dlg.rejected.connect(task.cancel)
+        
+        self._submit_task(task)
+
+    # =========================================================================
+    # Points → GeoTIFF
+    # =========================================================================
+    
+    def full_process_dialog(self):
+        self._gdal_dialog('Points → GeoTIFF', [
+            ('Points File', 'points_file', 'points_file'),
+            ('Input Image', 'input_file', 'input_file'),
+            ('Target CRS', 'crs', 'crs'),
+            ('Transformation', 'transform', 'transform'),
+            ('Resampling', 'resample', 'resample'),
+            ('Compression', 'compress', 'compress'),
+            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
+            ('Output GeoTIFF', 'output_file', 'output_geotiff')
+        ], self.full_process)
+
+    def full_process(self, values):
+        """Create GeoTIFF from points file using background task."""
+        pf = values['points_file']
+        tif = values['input_file']
+        crs = values['crs']
+        transform = values['transform']
+        resample = values['resample']
+        compress = values['compress']
+        jpeg_quality = values['jpeg_quality']
+        out_tif = values['output_file']
+        auto_load = values['auto_load']
+        progress = values['progress']
+        status = values['status']
+        dlg = values['dialog']
+        run_btn = values['run_button']
+        
+        # Validate inputs (one stat per file)
+        if self.stat_or_none(pf) is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid points file.")
+            return
+        tif_stat = self.stat_or_none(tif)
+        if tif_stat is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid input image.")
+            return
+        if not out_tif:
+            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
+            return
+
+        # Check if output file exists
+        if self.stat_or_none(out_tif) is not None:
+            reply = QMessageBox.question(
+                dlg, "File Exists",
+                f"Output file already exists:\n{os.path.basename(out_tif)}\n\nOverwrite?",
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+            try:
+                os.remove(out_tif)
+            except Exception as e:
+                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
+                return
+        
+        # Parse GCPs from points file (cached across re-runs)
+        try:
+            gcp_data = self.get_gcp_data(pf)
+            if gcp_data['count'] == 0:
+                QMessageBox.warning(dlg, "Error", "No enabled GCPs found in points file.")
+                return
+        except Exception as e:
+            QMessageBox.warning(dlg, "Error", f"Failed to read points file: {e}")
+            return
+        
+        # Validate GCP count for selected transformation
+        is_valid, warning_msg = self.validate_gcps_for_transform(gcp_data['count'], transform)
+        if not is_valid:
+            QMessageBox.critical(dlg, "Insufficient GCPs", warning_msg)
+            return
+        if warning_msg:
+            reply = QMessageBox.warning(
+                dlg, "GCP Warning", warning_msg,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+        
+        # Check GCP distribution
+        distribution_warning = self.check_gcp_distribution(gcp_data['gcps'])
+        if distribution_warning:
+            reply = QMessageBox.warning(
+                dlg, "GCP Distribution Warning", distribution_warning,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+        
+        # Build creation options
+        # IF_SAFER lets GDAL decide on BigTIFF from the actual uncompressed
+        # output size — an input-size heuristic misses compressed inputs
+        # that expand past the classic 4 GB limit after warping
+        creation_options = ['BIGTIFF=IF_SAFER', 'TILED=YES',
+                            'NUM_THREADS=ALL_CPUS', f'COMPRESS={compress}']
+        if compress == 'JPEG':
+            creation_options.append(f'JPEG_QUALITY={jpeg_quality}')
+        predictor = _predictor_option(tif, compress)
+        if predictor:
+            creation_options.append(predictor)
+
+        mem_mb = self.gdal_cache_mb()
+
+        # Show progress
+        progress.setVisible(True)
+        progress.setValue(0)
+        status.setText("Processing...")
+        run_btn.setEnabled(False)
+
+        # Create task (shared pipeline builder)
+        task = self._points_task(
+            'Raster Blaster: Creating GeoTIFF', tif, gcp_data, crs,
+            transform, resample, creation_options, mem_mb, out_tif,
+            cog=False
+        )
+
+        def on_complete():
+            progress.setVisible(False)
+            run_btn.setEnabled(True)
+
+            # Cancelled first: a cancel while queued or between steps never
+            # sets error_message, and a mid-step one records "User
+            # terminated" — neither deserves a success or failure toast
+            if task.isCanceled():
+                status.setText("Cancelled")
+            elif task.error_message:
+                status.setText(f"Error: {task.error_message[:100]}")
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: GeoTIFF failed: {task.error_message}',
+                    'Raster Blaster', level=Qgis.Critical
+                )
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    "GeoTIFF creation failed",
+                    level=Qgis.Critical
+                )
+            else:
+                mins, secs = divmod(int(task.elapsed_time), 60)
+                tstr = f"{mins:02d}:{secs:02d}"
+                status.setText(f"Complete! ({tstr})")
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"GeoTIFF created: {os.path.basename(out_tif)} ({tstr})",
+                    level=Qgis.Success
+                )
+                
+                if auto_load:
+                    self.load_raster_layer(out_tif)
+                
+                dlg.accept()
+        
+        task.taskCompleted.connect(on_complete)
+        task.taskTerminated.connect(on_complete)
+        task.progressChanged.connect(lambda p: progress.setValue(int(p)))
+        # Closing the dialog mid-run cancels the job; the GDAL progress
+        # callback sees the flag and aborts the running step
+        dlg.rejected.connect(task.cancel)
+        
+        self._submit_task(task)
+
+    # =========================================================================
+    # Points → COG
+    # =========================================================================
+    
+    def full_to_cog_dialog(self):
+        self._gdal_dialog('Points → COG', [
+            ('Points File', 'points_file', 'points_file'),
+            ('Input Image', 'input_file', 'input_file'),
+            ('Target CRS', 'crs', 'crs'),
+            ('Transformation', 'transform', 'transform'),
+            ('Resampling', 'resample', 'resample'),
+            ('Compression', 'compress', 'compress'),
+            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
+            ('Output COG', 'output_file', 'output_cog')
+        ], self.full_to_cog)
+
+    def full_to_cog(self, values):
+        """Create COG from points file using background task."""
+        pf = values['points_file']
+        tif = values['input_file']
+        crs = values['crs']
+        transform = values['transform']
+        resample = values['resample']
+        compress = values['compress']
+        jpeg_quality = values['jpeg_quality']
+        out_cog = values['output_file']
+        auto_load = values['auto_load']
+        progress = values['progress']
+        status = values['status']
+        dlg = values['dialog']
+        run_btn = values['run_button']
+        
+        # Validate inputs (one stat per file)
+        if self.stat_or_none(pf) is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid points file.")
+            return
+        if self.stat_or_none(tif) is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid input image.")
+            return
+        if not out_cog:
+            QMessageBox.warning(dlg, "Error", "Please specify an output file.")
+            return
+
+        # Check if output file exists
+        if self.stat_or_none(out_cog) is not None:
+            reply = QMessageBox.question(
+                dlg, "File Exists",
+                f"Output file already exists:\n{os.path.basename(out_cog)}\n\nOverwrite?",
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+            try:
+                os.remove(out_cog)
+            except Exception as e:
+                QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
+                return
+        
+        # Parse GCPs (cached across re-runs)
+        try:
+            gcp_data = self.get_gcp_data(pf)
+            if gcp_data['count'] == 0:
+                QMessageBox.warning(dlg, "Error", "No enabled GCPs found in points file.")
+                return
+        except Exception as e:
+            QMessageBox.warning(dlg, "Error", f"Failed to read points file: {e}")
+            return
+        
+        # Validate GCP count for selected transformation
+        is_valid, warning_msg = self.validate_gcps_for_transform(gcp_data['count'], transform)
+        if not is_valid:
+            QMessageBox.critical(dlg, "Insufficient GCPs", warning_msg)
+            return
+        if warning_msg:
+            reply = QMessageBox.warning(
+                dlg, "GCP Warning", warning_msg,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+        
+        # Check GCP distribution
+        distribution_warning = self.check_gcp_distribution(gcp_data['gcps'])
+        if distribution_warning:
+            reply = QMessageBox.warning(
+                dlg, "GCP Distribution Warning", distribution_warning,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+        
+        # Build creation options
+        # IF_SAFER lets GDAL pick the classic TIFF layout when the output
+        # plainly fits under 4 GB, avoiding BigTIFF's wider offsets
+        creation_options = ['BIGTIFF=IF_SAFER', 'NUM_THREADS=ALL_CPUS',
+                            f'COMPRESS={compress}']
+        if compress == 'JPEG':
+            creation_options.append(f'QUALITY={jpeg_quality}')
+        predictor = _predictor_option(tif, compress)
+        if predictor:
+            creation_options.append(predictor)
+        # Matches the 512px tiling of the warp intermediate below, so the
+        # COG pass reads whole aligned blocks
+        creation_options.append('BLOCKSIZE=512')
+
+        mem_mb = self.gdal_cache_mb()
+
+        # Show progress
+        progress.setVisible(True)
+        progress.setValue(0)
+        status.setText("Processing...")
+        run_btn.setEnabled(False)
+
+        # Create task (shared pipeline builder)
+        task = self._points_task(
+            'Raster Blaster: Creating COG', tif, gcp_data, crs,
+            transform, resample, creation_options, mem_mb, out_cog,
+            cog=True
+        )
+
+        def on_complete():
+            progress.setVisible(False)
+            run_btn.setEnabled(True)
+
+            # Cancelled first: a cancel while queued or between steps never
+            # sets error_message, and a mid-step one records "User
+            # terminated" — neither deserves a success or failure toast
+            if task.isCanceled():
+                status.setText("Cancelled")
+            elif task.error_message:
+                status.setText(f"Error: {task.error_message[:100]}")
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: COG failed: {task.error_message}',
+                    'Raster Blaster', level=Qgis.Critical
+                )
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    "COG creation failed",
+                    level=Qgis.Critical
+                )
+            else:
+                mins, secs = divmod(int(task.elapsed_time), 60)
+                tstr = f"{mins:02d}:{secs:02d}"
+                status.setText(f"Complete! ({tstr})")
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"COG created: {os.path.basename(out_cog)} ({tstr})",
+                    level=Qgis.Success
+                )
+                
+                if auto_load:
+                    self.load_raster_layer(out_cog)
+                
+                dlg.accept()
+        
+        task.taskCompleted.connect(on_complete)
+        task.taskTerminated.connect(on_complete)
+        task.progressChanged.connect(lambda p: progress.setValue(int(p)))
+        # Closing the dialog mid-run cancels the job; the GDAL progress
+        # callback sees the flag and aborts the running step
+        dlg.rejected.connect(task.cancel)
+        
+        self._submit_task(task)
+
+    # =========================================================================
+    # Points → GeoTIFF + COG
+    # =========================================================================
+
+    def full_to_both_dialog(self):
+        self._gdal_dialog('Points → GeoTIFF + COG', [
+            ('Points File', 'points_file', 'points_file'),
+            ('Input Image', 'input_file', 'input_file'),
+            ('Target CRS', 'crs', 'crs'),
+            ('Transformation', 'transform', 'transform'),
+            ('Resampling', 'resample', 'resample'),
+            ('Compression', 'compress', 'compress'),
+            ('JPEG Quality', 'jpeg_quality', 'jpeg_quality'),
+            ('Output GeoTIFF', 'output_file', 'output_geotiff'),
+            ('Output COG', 'output_cog_file', 'output_cog')
+        ], self.full_to_both)
+
+    def full_to_both(self, values):
+        """
+        Create both a GeoTIFF and a COG from one points file. The two
+        jobs go through the task queue as separate submissions, so on a
+        multi-core box the COG's compression overlaps the GeoTIFF's warp
+        instead of running after it.
+        """
+        pf = values['points_file']
+        tif = values['input_file']
+        crs = values['crs']
+        transform = values['transform']
+        resample = values['resample']
+        compress = values['compress']
+        jpeg_quality = values['jpeg_quality']
+        out_tif = values['output_file']
+        out_cog = values['output_cog_file']
+        auto_load = values['auto_load']
+        progress = values['progress']
+        status = values['status']
+        dlg = values['dialog']
+        run_btn = values['run_button']
+
+        # Validate inputs (one stat per file)
+        if self.stat_or_none(pf) is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid points file.")
+            return
+        tif_stat = self.stat_or_none(tif)
+        if tif_stat is None:
+            QMessageBox.warning(dlg, "Error", "Please select a valid input image.")
+            return
+        if not out_tif or not out_cog:
+            QMessageBox.warning(dlg, "Error", "Please specify both output files.")
+            return
+        if os.path.abspath(out_tif) == os.path.abspath(out_cog):
+            QMessageBox.warning(dlg, "Error", "The two outputs must be different files.")
+            return
+
+        # Check if output files exist
+        for out_path in (out_tif, out_cog):
+            if self.stat_or_none(out_path) is not None:
+                reply = QMessageBox.question(
+                    dlg, "File Exists",
+                    f"Output file already exists:\n{os.path.basename(out_path)}\n\nOverwrite?",
+                    QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+                )
+                if reply == QMessageBoxNo:
+                    return
+                try:
+                    os.remove(out_path)
+                except Exception as e:
+                    QMessageBox.critical(dlg, "Error", f"Cannot delete existing file:\n{e}")
+                    return
+
+        # Parse GCPs (cached across re-runs)
+        try:
+            gcp_data = self.get_gcp_data(pf)
+            if gcp_data['count'] == 0:
+                QMessageBox.warning(dlg, "Error", "No enabled GCPs found in points file.")
+                return
+        except Exception as e:
+            QMessageBox.warning(dlg, "Error", f"Failed to read points file: {e}")
+            return
+
+        # Validate GCP count for selected transformation
+        is_valid, warning_msg = self.validate_gcps_for_transform(gcp_data['count'], transform)
+        if not is_valid:
+            QMessageBox.critical(dlg, "Insufficient GCPs", warning_msg)
+            return
+        if warning_msg:
+            reply = QMessageBox.warning(
+                dlg, "GCP Warning", warning_msg,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+
+        # Check GCP distribution
+        distribution_warning = self.check_gcp_distribution(gcp_data['gcps'])
+        if distribution_warning:
+            reply = QMessageBox.warning(
+                dlg, "GCP Distribution Warning", distribution_warning,
+                QMessageBoxYes | QMessageBoxNo, QMessageBoxNo
+            )
+            if reply == QMessageBoxNo:
+                return
+
+        predictor = _predictor_option(tif, compress)
+
+        # GeoTIFF creation options (same shape as full_process)
+        tif_options = ['BIGTIFF=IF_SAFER', 'TILED=YES',
+                       'NUM_THREADS=ALL_CPUS', f'COMPRESS={compress}']
+        if compress == 'JPEG':
+            tif_options.append(f'JPEG_QUALITY={jpeg_quality}')
+        if predictor:
+            tif_options.append(predictor)
+
+        # COG creation options (same shape as full_to_cog)
+        cog_options = ['BIGTIFF=IF_SAFER', 'NUM_THREADS=ALL_CPUS',
+                       f'COMPRESS={compress}']
+        if compress == 'JPEG':
+            cog_options.append(f'QUALITY={jpeg_quality}')
+        if predictor:
+            cog_options.append(predictor)
+        cog_options.append('BLOCKSIZE=512')
+
+        mem_mb = self.gdal_cache_mb()
+
+        # Show progress
+        progress.setVisible(True)
+        progress.setValue(0)
+        status.setText("Processing...")
+        run_btn.setEnabled(False)
+
+        tif_task = self._points_task(
+            'Raster Blaster: Creating GeoTIFF', tif, gcp_data, crs,
+            transform, resample, tif_options, mem_mb, out_tif, cog=False
+        )
+        cog_task = self._points_task(
+            'Raster Blaster: Creating COG', tif, gcp_data, crs,
+            transform, resample, cog_options, mem_mb, out_cog, cog=True
+        )
+        tasks = [(tif_task, 'GeoTIFF', out_tif), (cog_task, 'COG', out_cog)]
+
+        # The dialog has one progress bar; show the average of the two jobs
+        task_progress = dict.fromkeys((id(t) for t, _, _ in tasks), 0.0)
+
+        def on_progress(task, p):
+            task_progress[id(task)] = p
+            progress.setValue(int(sum(task_progress.values()) / len(task_progress)))
+
+        state = {'pending': len(tasks), 'failed': False, 'cancelled': False}
+
+        def on_task_done(task, label, out_path):
+            state['pending'] -= 1
+            # Cancelled first: with the concurrency cap the second task can
+            # sit queued, and cancelling it there (or between steps) never
+            # sets error_message — don't toast success for a file that was
+            # never written
+            if task.isCanceled():
+                state['cancelled'] = True
+            elif task.error_message:
+                state['failed'] = True
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: {label} failed: {task.error_message}',
+                    'Raster Blaster', level=Qgis.Critical
+                )
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"{label} creation failed",
+                    level=Qgis.Critical
+                )
+            else:
+                self.iface.messageBar().pushMessage(
+                    "Raster Blaster",
+                    f"{label} created: {os.path.basename(out_path)}",
+                    level=Qgis.Success
+                )
+                if auto_load:
+                    self.load_raster_layer(out_path)
+
+            if state['pending'] == 0:
+                progress.setVisible(False)
+                run_btn.setEnabled(True)
+                if state['failed']:
+                    status.setText("Finished with errors")
+                elif state['cancelled']:
+                    status.setText("Cancelled")
+                else:
+                    status.setText("Complete!")
+                    dlg.accept()
+
+        for task, label, out_path in tasks:
+            done = functools.partial(on_task_done, task, label, out_path)
+            task.taskCompleted.connect(done)
+            task.taskTerminated.connect(done)
+            task.progressChanged.connect(functools.partial(on_progress, task))
+            dlg.rejected.connect(task.cancel)
+            self._submit_task(task)
+
+    # =========================================================================
+    # Utility methods
+    # =========================================================================
+
+    def _points_task(self, description, tif, gcp_data, crs, transform,
+                     resample, creation_options, mem_mb, out_path, cog=False):
+        """
+        Build the background task for a Points workflow: GCP'd VRT, then
+        either a straight GeoTIFF warp or the tiled-intermediate COG
+        pipeline with validation. Falls back to the CLI tools when the
+        GDAL bindings are unavailable.
+        """
+        if gdal is not None:
+            srs = self._srs_wkt(crs)
+            gcps = [gdal.GCP(mx, my, 0.0, sx, sy)
+                    for sx, sy, mx, my in gcp_data['gcps']]
+            warp_kwargs = self._transform_kwargs(transform)
+
+            def translate_vrt(prev, progress_cb):
+                return gdal.Translate(
+                    '', tif,
+                    format='VRT',
+                    GCPs=gcps,
+                    outputSRS=srs,
+                    callback=progress_cb
+                )
+
+            if cog:
+                tmp_tif = tempfile.NamedTemporaryFile(delete=False,
+                                                      suffix='.tif')
+                tmp_tif.close()
+                warp_tmp = tmp_tif.name
+
+                def warp_tiff(prev, progress_cb):
+                    return gdal.Warp(
+                        warp_tmp, prev,
+                        format='GTiff',
+                        dstSRS=srs,
+                        resampleAlg=resample,
+                        multithread=True,
+                        warpMemoryLimit=mem_mb,
+                        warpOptions=['NUM_THREADS=ALL_CPUS'],
+                        creationOptions=['TILED=YES', 'BLOCKXSIZE=512',
+                                         'BLOCKYSIZE=512', 'SPARSE_OK=YES',
+                                         'COMPRESS=NONE', 'BIGTIFF=YES',
+                                         'NUM_THREADS=ALL_CPUS'],
+                        callback=progress_cb,
+                        **warp_kwargs
+                    )
+
+                def translate_cog(prev, progress_cb):
+                    ds = gdal.Translate(
+                        out_path, prev,
+                        format='COG',
+                        creationOptions=creation_options,
+                        callback=progress_cb
+                    )
+                    if ds is None:
+                        return None
+                    # Closed here so the validation step can reopen and, if
+                    # needed, overwrite the file (Windows sharing rules).
+                    ds = None
+                    return True
+
+                return GdalPyTask(
+                    description,
+                    [
+                        (translate_vrt, 'gdal.Translate → VRT'),
+                        (warp_tiff, 'gdal.Warp → tiled GeoTIFF'),
+                        (translate_cog, 'gdal.Translate → COG'),
+                        (_validate_cog_step(out_path, creation_options),
+                         'COG validation')
+                    ],
+                    cleanup_files=[warp_tmp],
+                    output_file=out_path,
+                    # Per-job memory goes through warpMemoryLimit above; a
+                    # GDAL_CACHEMAX config option is dead in-process (the
+                    # block cache is sized once, at first use)
+                    config_options=_remote_io_options(tif)
+                )
+
+            def warp_geotiff(prev, progress_cb):
+                return gdal.Warp(
+                    out_path, prev,
+                    format='GTiff',
+                    dstSRS=srs,
+                    resampleAlg=resample,
+                    multithread=True,
+                    warpMemoryLimit=mem_mb,
+                    warpOptions=['NUM_THREADS=ALL_CPUS'],
+                    creationOptions=creation_options,
+                    callback=progress_cb,
+                    **warp_kwargs
+                )
+
+            return GdalPyTask(
+                description,
+                [
+                    (translate_vrt, 'gdal.Translate → VRT'),
+                    (warp_geotiff, 'gdal.Warp → GeoTIFF')
+                ],
+                output_file=out_path,
+                config_options=_remote_io_options(tif)
+            )
+
+        # Fallback: shell out to the GDAL command line tools, handing
+        # the VRT over via a temp file and the GCPs via an optfile
+        tmp_vrt = tempfile.NamedTemporaryFile(delete=False, suffix='.vrt')
+        tmp_vrt.close()
+        vrt_path = tmp_vrt.name
+
+        gcp_optfile = self.write_gcp_optfile(gcp_data['args'])
+        cmd1 = ['gdal_translate', '-of', 'VRT', '--optfile', gcp_optfile,
+                tif, vrt_path]
+
+        cmd2 = [
+            'gdalwarp',
+            '-t_srs', crs.authid(),
+            '-r', resample,
+            *self._transform_cli_args(transform),
+            '--config', 'GDAL_NUM_THREADS', 'ALL_CPUS',
+            '--config', 'GDAL_CACHEMAX', str(mem_mb),
+            '-wm', str(mem_mb),
+            '-wo', 'NUM_THREADS=ALL_CPUS',
+            '-multi'
+        ]
+        if cog:
+            cmd2[1:1] = ['-of', 'COG']
+        for co in creation_options:
+            cmd2.extend(['-co', co])
+        cmd2.extend([vrt_path, out_path])
+
+        return GdalTask(
+            description,
+            [
+                (cmd1, 'gdal_translate → VRT'),
+                (cmd2, f'gdalwarp → {"COG" if cog else "GeoTIFF"}')
+            ],
+            cleanup_files=[vrt_path, gcp_optfile],
+            output_file=out_path
+        )
+
+    def _submit_task(self, task):
+        """
+        Hand a task to the manager, or queue it when the concurrency cap
+        is reached. Back-to-back jobs no longer serialize one behind the
+        other, and a large batch starts at most MAX_CONCURRENT_TASKS at
+        once instead of oversubscribing the CPU.
+        """
+        task.taskCompleted.connect(functools.partial(self._task_finished, task))
+        task.taskTerminated.connect(functools.partial(self._task_finished, task))
+        self.active_tasks.append(task)
+        if self._running_tasks < self.MAX_CONCURRENT_TASKS:
+            self._start_task(task)
+        else:
+            self._task_queue.append(task)
+
+    def _start_task(self, task):
+        """Take a concurrency slot and hand the task to the manager."""
+        self._running_tasks += 1
+        self._started_tasks.add(task)
+        QgsApplication.taskManager().addTask(task)
+
+    def _task_finished(self, task):
+        """
+        Release the task's slot and start the next queued one. A task
+        cancelled while still parked in the queue emits taskTerminated
+        without ever taking a slot — it is only dropped from the queue,
+        so the running count stays honest.
+        """
+        if task in self._started_tasks:
+            self._started_tasks.discard(task)
+            self._running_tasks = max(0, self._running_tasks - 1)
+        else:
+            try:
+                self._task_queue.remove(task)
+            except ValueError:
+                pass
+        if self._task_queue and self._running_tasks < self.MAX_CONCURRENT_TASKS:
+            self._start_task(self._task_queue.popleft())
+
+    @staticmethod
+    def write_gcp_optfile(gcp_args):
+        """
+        Write '-gcp' arguments to a temp file for GDAL's --optfile.
+        Five argv tokens per GCP approach ARG_MAX for dense auto-matched
+        points files, and large argv slows process spawn; an optfile
+        keeps the command line a handful of tokens. Returns the path
+        (caller adds it to cleanup_files).
+        """
+        tmp = tempfile.NamedTemporaryFile(
+            'w', delete=False, suffix='.txt', prefix='rb_gcps_')
+        with tmp:
+            for i in range(0, len(gcp_args), 5):
+                tmp.write(' '.join(gcp_args[i:i + 5]) + '\n')
+        return tmp.name
+
+    def _srs_wkt(self, crs):
+        """
+        WKT for the selected CRS, cached per authid. gdal.Warp accepts
+        the authid string too, but then PROJ resolves it on every run;
+        the WKT is the already-resolved form.
+        """
+        authid = crs.authid()
+        if not authid:
+            return crs.toWkt()
+        wkt = self._srs_wkt_cache.get(authid)
+        if wkt is None:
+            wkt = crs.toWkt()
+            self._srs_wkt_cache[authid] = wkt
+        return wkt
+
+    @staticmethod
+    def _transform_kwargs(transform):
+        """
+        Map the dialog's transform string to gdal.Warp keyword arguments:
+        {'polynomialOrder': n} for the polynomial entries, {'tps': True}
+        and friends for the rest. Shared by both Points workflows.
+        """
+        t = transform.lower()
+        if t.startswith('polynomial'):
+            order_match = _POLY_ORDER_RE.search(t)
+            return {'polynomialOrder': int(order_match.group(1)) if order_match else 1}
+        return {t: True}
+
+    @staticmethod
+    def _transform_cli_args(transform):
+        """The gdalwarp CLI spelling of _transform_kwargs, for the fallback."""
+        t = transform.lower()
+        if t.startswith('polynomial'):
+            order_match = _POLY_ORDER_RE.search(t)
+            return ['-order', order_match.group(1) if order_match else '1']
+        return [f'-{t}']
+
+    @staticmethod
+    def stat_or_none(path):
+        """
+        Probe a file with a single stat syscall.
+        Returns the os.stat_result, or None if the path is empty/missing.
+        """
+        if not path:
+            return None
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def gdal_cache_mb(self):
+        """
+        Per-job memory budget from available RAM: 25% of free memory,
+        clamped to 256-4096 MB. Feeds warpMemoryLimit and, for the CLI
+        fallbacks, GDAL_CACHEMAX (a fresh process, where the cache
+        sizing actually takes). Falls back to a fixed 1024 MB when
+        psutil is unavailable.
+        """
+        if psutil is None:
+            return 1024
+        try:
+            available = psutil.virtual_memory().available
+        except Exception:
+            return 1024
+        return min(4096, max(256, int(available / (4 * 1024 * 1024))))
+
+    def get_gcp_data(self, filepath):
+        """
+        Parse a points file, caching the result until the file changes on
+        disk. Users commonly re-run the same file while tweaking
+        compression or CRS; a hit costs one dict lookup (invalidation is
+        pushed by QFileSystemWatcher rather than polled via mtime).
+        Cache is session-scoped and LRU-bounded.
+        """
+        cached = self._gcp_cache.get(filepath)
+        if cached is not None:
+            self._gcp_cache.move_to_end(filepath)
+            return cached
+
+        gcp_data = self.parse_points_file(filepath)
+        self._gcp_cache[filepath] = gcp_data
+        self._gcp_watcher.addPath(filepath)
+        while len(self._gcp_cache) > self.GCP_CACHE_SIZE:
+            old_path, _ = self._gcp_cache.popitem(last=False)
+            self._gcp_watcher.removePath(old_path)
+        return gcp_data
+
+    def _invalidate_gcp_cache(self, path):
+        """Drop a watched points file from the cache when it changes on disk."""
+        self._gcp_cache.pop(path, None)
+        # Editors often replace rather than rewrite the file, which breaks
+        # the watch; drop it and re-add on the next parse
+        self._gcp_watcher.removePath(path)
+
+    def parse_points_file(self, filepath):
+        """
+        Parse a QGIS .points file and return GCP info.
+        
+        Returns dict with:
+            'args': list like ['-gcp', 'sx', 'sy', 'mx', 'my', ...]
+            'count': number of enabled GCPs
+            'gcps': list of (sx, sy, mx, my) tuples for validation
+        """
+        result = {
+            'args': [],
+            'count': 0,
+            'gcps': []
+        }
+        
+        # Read the file once as bytes and decode permissively: utf-8-sig
+        # strips the BOM from QGIS exports, errors='replace' copes with
+        # stray windows-1252 bytes. The numeric columns we feed to NumPy
+        # are plain ASCII either way, and this avoids re-reading the whole
+        # file once per candidate encoding.
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+        content = raw.decode('utf-8-sig', errors='replace')
+        
+        # Filter out comments and empty lines
+        lines = [l for l in content.splitlines() if l.strip() and not l.startswith('#')]
+
+        if len(lines) < 2:
+            return result
+
+        # Resolve column indices from the header row once, then hand the
+        # numeric rows to NumPy: parsing happens in C instead of per-row
+        # Python float() calls and dict construction
+        header = [h.strip() for h in lines[0].split(',')]
+        try:
+            usecols = [header.index(c)
+                       for c in ('sourceX', 'sourceY', 'mapX', 'mapY')]
+        except ValueError:
+            raise ValueError("Points file is missing sourceX/sourceY/mapX/mapY columns")
+        has_enable = 'enable' in header
+        if has_enable:
+            usecols.append(header.index('enable'))
+
+        data = np.genfromtxt(
+            io.StringIO('\n'.join(lines[1:])),
+            delimiter=',',
+            usecols=usecols,
+            dtype=np.float64,
+            invalid_raise=False
+        )
+        if data.size == 0:
+            return result
+        data = np.atleast_2d(data)
+
+        # Keep enabled rows with valid numeric coordinates
+        coord_ok = ~np.isnan(data[:, :4]).any(axis=1)
+        if has_enable:
+            enabled = data[:, 4] == 1
+        else:
+            enabled = np.ones(len(data), dtype=bool)
+
+        skipped = int(np.count_nonzero(enabled & ~coord_ok))
+        if skipped:
+            QgsMessageLog.logMessage(
+                f'Raster Blaster: Skipped {skipped} invalid GCP row(s)',
+                'Raster Blaster', level=Qgis.Warning
+            )
+
+        rows = data[enabled & coord_ok]
+
+        # Drop duplicate source pixels (same point picked twice in the
+        # Georeferencer): redundant equations slow the polynomial solve
+        # and blow up the O(N^2) TPS kernel downstream. Round to 1/1000
+        # of a pixel so float noise doesn't defeat the comparison, and
+        # keep rows in their original order.
+        if len(rows) > 1:
+            keys = np.round(rows[:, :2], 3)
+            _, unique_idx = np.unique(keys, axis=0, return_index=True)
+            if len(unique_idx) < len(rows):
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Dropped {len(rows) - len(unique_idx)} '
+                    f'duplicate GCP(s)',
+                    'Raster Blaster', level=Qgis.Warning
+                )
+                rows = rows[np.sort(unique_idx)]
+
+        sx = rows[:, 0]
+        sy = -rows[:, 1]  # QGIS uses inverted Y for source
+        mx = rows[:, 2]
+        my = rows[:, 3]
+
+        gcps = list(zip(sx.tolist(), sy.tolist(), mx.tolist(), my.tolist()))
+        # One flattening pass instead of an extend per GCP; %.10g gives
+        # sub-centimetre map precision with shorter argv strings than
+        # str(float)
+        result['args'] = list(itertools.chain.from_iterable(
+            ('-gcp', f'{gsx:.10g}', f'{gsy:.10g}', f'{gmx:.10g}', f'{gmy:.10g}')
+            for gsx, gsy, gmx, gmy in gcps
+        ))
+        result['gcps'] = gcps
+        result['count'] = len(gcps)
+        return result
+    
+    def validate_gcps_for_transform(self, gcp_count, transform_type):
+        """
+        Validate that there are enough GCPs for the selected transformation.
+        
+        Returns tuple: (is_valid, warning_message or None)
+
+        The per-transform minimums live in the module-level
+        _TRANSFORM_RULES table (Polynomial order 1/2/3 need 3/6/10 GCPs;
+        TPS runs from 1 but wants 10+; RPC/Geoloc are lenient).
+        """
+        transform_lower = transform_type.lower()
+
+        if 'polynomial' in transform_lower:
+            order_match = _POLY_ORDER_RE.search(transform_lower)
+            key = 'polynomial' + (order_match.group(1) if order_match else '1')
+        else:
+            key = transform_lower
+
+        # RPC, Geoloc - less strict
+        min_gcps, recommended, transform_name = _TRANSFORM_RULES.get(
+            key, (1, 6, transform_type))
+
+        # Check requirements
+        if gcp_count < min_gcps:
+            return (False, 
+                f"{transform_name} requires at least {min_gcps} GCPs.\n"
+                f"You only have {gcp_count} enabled GCP(s).\n\n"
+                f"Please add more ground control points or choose a different transformation method."
+            )
+        elif gcp_count < recommended:
+            return (True,
+                f"Warning: {transform_name} works best with {recommended}+ GCPs.\n"
+                f"You have {gcp_count} GCP(s). Results may be less accurate.\n\n"
+                f"Continue anyway?"
+            )
+        
+        return (True, None)
+    
+    def check_gcp_distribution(self, gcps):
+        """
+        Check if GCPs are well-distributed across the image.
+        
+        Returns warning message if GCPs appear clustered, None otherwise.
+        """
+        if len(gcps) < 3:
+            return None
+
+        # Source coordinates as an (N, 2) array: all the reductions below
+        # run as single C-level NumPy passes instead of Python loops
+        src = np.asarray(gcps, dtype=np.float64)[:, :2]
+
+        # Calculate spread (using range as simple metric)
+        x_range, y_range = src.max(axis=0) - src.min(axis=0)
+
+        # Calculate centroid
+        cx, cy = src.mean(axis=0)
+
+        # Check if all points are in one quadrant relative to centroid
+        # (simple clustering detection). Two boolean comparisons and a
+        # bitwise OR produce a per-point quadrant id in one C-level pass.
+        quadrant_ids = ((src[:, 0] >= cx).astype(np.uint8)
+                        | ((src[:, 1] >= cy).astype(np.uint8) << 1))
+
+        if np.unique(quadrant_ids).size == 1 and len(gcps) >= 4:
+            return (
+                "Warning: All GCPs appear to be clustered in one area of the image.\n"
+                "For best results, distribute GCPs across all corners and edges.\n\n"
+                "Continue anyway?"
+            )
+
+        # Bin points into a 3x3 grid: if most cells are empty, the GCPs
+        # only cover a small part of the image even if they straddle
+        # the centroid
+        if len(gcps) >= 9:
+            hist, _, _ = np.histogram2d(src[:, 0], src[:, 1], bins=3)
+            if np.count_nonzero(hist) <= 3:
+                return (
+                    "Warning: GCPs cover only a small part of the image.\n"
+                    "For best results, distribute GCPs across all corners and edges.\n\n"
+                    "Continue anyway?"
+                )
+
+        # Check for very narrow spread (points nearly collinear)
+        if x_range > 0 and y_range > 0:
+            aspect = min(x_range, y_range) / max(x_range, y_range)
+            if aspect < 0.1 and len(gcps) >= 4:
+                return (
+                    "Warning: GCPs appear to be arranged in a nearly straight line.\n"
+                    "This may cause distortion. Try adding GCPs that form a wider pattern.\n\n"
+                    "Continue anyway?"
+                )
+
+        return None
+    
+    def load_raster_layer(self, filepath):
+        """Load a raster file into QGIS as a new layer."""
+        try:
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            layer = QgsRasterLayer(filepath, name, 'gdal')
+            
+            if layer.isValid():
+                QgsProject.instance().addMapLayer(layer)
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Added layer "{name}" to map',
+                    'Raster Blaster', level=Qgis.Info
+                )
+            else:
+                QgsMessageLog.logMessage(
+                    f'Raster Blaster: Failed to load layer from {filepath}',
+                    'Raster Blaster', level=Qgis.Warning
+                )
+        except Exception as e:
+            QgsMessageLog.logMessage(
+                f'Raster Blaster: Error loading layer: {e}',
+                'Raster Blaster', level=Qgis.Warning
+            )